@@ -19,6 +19,7 @@ from ...core import (
     calculate_material_requirements,
 )
 from ...models import UnitConfig, BendSheetData
+from ...models.types import ElementType, Point3D
 
 if TYPE_CHECKING:
     from ...core import PathElement
@@ -82,15 +83,31 @@ class BendSheetGenerator:
         Returns:
             GenerationResult with success status and data or error
         """
-        # Extract lines and arcs from ordered path
-        lines: list[adsk.fusion.SketchLine] = [
-            cast(adsk.fusion.SketchLine, e.entity)
-            for e in ordered_path if e.element_type == "line"
-        ]
-        arcs: list[adsk.fusion.SketchArc] = [
-            cast(adsk.fusion.SketchArc, e.entity)
-            for e in ordered_path if e.element_type == "arc"
-        ]
+        # Split ordered path into lines and arcs in a single pass
+        lines: list[adsk.fusion.SketchLine] = []
+        line_endpoints: list[tuple[Point3D, Point3D]] = []
+        arcs: list[adsk.fusion.SketchArc] = []
+        for element in ordered_path:
+            if element.element_type is ElementType.LINE:
+                lines.append(cast(adsk.fusion.SketchLine, element.entity))
+                line_endpoints.append(element.endpoints)
+            else:
+                arcs.append(cast(adsk.fusion.SketchArc, element.entity))
+
+        # Reject unusable geometry before any calculation work
+        if not lines:
+            return GenerationResult(
+                success=False,
+                error="No straight sections found in path. Cannot generate bend sheet.",
+            )
+        if len(lines) < len(arcs) + 1:
+            return GenerationResult(
+                success=False,
+                error=(
+                    f"Insufficient straight sections ({len(lines)}) for {len(arcs)} bend(s). "
+                    "Each bend needs a straight section before and after it."
+                ),
+            )
 
         # Validate CLR consistency
         clr, clr_mismatch, clr_values = validate_clr_consistency(arcs, self._units)
@@ -103,17 +120,12 @@ class BendSheetGenerator:
             )
 
         # Calculate straights and bends
+        # Reuse endpoints captured when the path was built rather than
+        # querying Fusion for each line's world geometry again
         straights, bends = calculate_straights_and_bends(
-            lines, arcs, start_point, clr, self._units
+            lines, arcs, start_point, clr, self._units, line_endpoints
         )
 
-        # Validate we have straight sections
-        if not straights:
-            return GenerationResult(
-                success=False,
-                error="No straight sections found in path. Cannot generate bend sheet.",
-            )
-
         # Direction-aware validation for middle straights
         if params.min_grip > 0 and len(straights) > 2:
             direction_result = validate_direction_aware(
@@ -141,14 +153,10 @@ class BendSheetGenerator:
         )
 
         # Build segments and mark positions
-        segments, mark_positions = build_segments_and_marks(
+        segments, mark_positions, total_centerline = build_segments_and_marks(
             straights, bends, material.extra_material, params.die_offset
         )
 
-        # Calculate totals
-        total_straights: float = sum(s.length for s in straights)
-        total_arcs: float = sum(b.arc_length for b in bends)
-        total_centerline: float = total_straights + total_arcs
         # Extra allowance is added to both ends (2x)
         total_extra_allowance: float = params.extra_allowance * 2
         total_cut_length: float = (
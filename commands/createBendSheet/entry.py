@@ -14,6 +14,7 @@ import adsk.fusion
 
 from ...lib import fusionAddInUtils as futil
 from ... import config
+from ...core import clear_endpoint_cache
 from ...models import UnitConfig
 from ...storage import ProfileManager, AttributeManager
 from ...storage.attributes import TubeSettings
@@ -132,7 +133,9 @@ def command_created(args: adsk.core.CommandCreatedEventArgs) -> None:
         ui.messageBox(str(e), 'Unsupported Units')
         return
 
-    # Validate selection
+    # Validate selection. Endpoints cached from here are reused when the
+    # command executes, since geometry can't change while the dialog is open.
+    clear_endpoint_cache()
     validator = SelectionValidator(units)
     result = validator.validate_for_dialog(ui.activeSelections)
 
@@ -330,3 +333,4 @@ def command_destroy(args: adsk.core.CommandEventArgs) -> None:
     futil.log(f'{CMD_NAME} Command Destroy Event')
     global local_handlers
     local_handlers = []
+    clear_endpoint_cache()
@@ -15,6 +15,7 @@ from ...core import (
     build_ordered_path,
     validate_path_alternation,
 )
+from ...models.types import ElementType
 
 
 @dataclass(slots=True)
@@ -53,11 +54,8 @@ def build_path_from_geometry(
         PathBuildResult with ordered path or error
     """
     # Build path elements
-    elements: list[PathElement] = []
-    for line in lines:
-        elements.append(PathElement("line", line))
-    for arc in arcs:
-        elements.append(PathElement("arc", arc))
+    elements: list[PathElement] = [PathElement(ElementType.LINE, line) for line in lines]
+    elements.extend(PathElement(ElementType.ARC, arc) for arc in arcs)
 
     # Order path by connectivity
     ordered, path_error = build_ordered_path(elements)
@@ -78,6 +76,6 @@ def build_path_from_geometry(
     return PathBuildResult(
         success=True,
         ordered_path=ordered,
-        starts_with_arc=ordered[0].element_type == "arc",
-        ends_with_arc=ordered[-1].element_type == "arc",
+        starts_with_arc=ordered[0].element_type is ElementType.ARC,
+        ends_with_arc=ordered[-1].element_type is ElementType.ARC,
     )
@@ -9,6 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from ...core import (
+    EndpointIndex,
     PathElement,
     get_free_endpoint,
     get_component_name,
@@ -64,8 +65,10 @@ def normalize_path_direction(
         DirectionResult with normalized path and direction info
     """
     # Get endpoints of the path
-    start_point = get_free_endpoint(ordered_path[0], ordered_path)
-    end_point = get_free_endpoint(ordered_path[-1], ordered_path)
+    endpoint_index = EndpointIndex(ordered_path)
+    last = len(ordered_path) - 1
+    start_point = get_free_endpoint(ordered_path[0], ordered_path, endpoint_index, own_index=0)
+    end_point = get_free_endpoint(ordered_path[last], ordered_path, endpoint_index, own_index=last)
 
     # Get component name from first entity
     component_name = get_component_name(ordered_path[0].entity)
@@ -45,17 +45,23 @@ def extract_geometry(
     arcs: list[adsk.fusion.SketchArc] = []
     first_entity: adsk.fusion.SketchEntity | None = None
 
-    for i in range(selections.count):
-        entity = selections.item(i).entity
+    # Bind API accessors once; each lookup on the Fusion wrappers is costly
+    count = selections.count
+    get_item = selections.item
+    cast_line = adsk.fusion.SketchLine.cast
+    cast_arc = adsk.fusion.SketchArc.cast
+
+    for i in range(count):
+        entity = get_item(i).entity
         if first_entity is None:
             first_entity = entity
 
-        line = adsk.fusion.SketchLine.cast(entity)
+        line = cast_line(entity)
         if line:
             lines.append(line)
             continue
 
-        arc = adsk.fusion.SketchArc.cast(entity)
+        arc = cast_arc(entity)
         if arc:
             arcs.append(arc)
 
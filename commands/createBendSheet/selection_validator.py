@@ -145,19 +145,6 @@ class SelectionValidator:
             opposite_direction=direction.opposite_direction,
         )
 
-    def validate_for_execution(
-        self,
-        selections: adsk.core.Selections,
-    ) -> SelectionResult:
-        """Validate for command execution.
-
-        This is equivalent to validate_for_dialog() since that method
-        performs all necessary validation and geometry extraction.
-
-        Args:
-            selections: Active selections from the UI
-
-        Returns:
-            SelectionResult with full validation and geometry data
-        """
-        return self.validate_for_dialog(selections)
+    # Execution needs exactly the validation and geometry the dialog does;
+    # alias rather than wrap so callers skip an extra frame.
+    validate_for_execution = validate_for_dialog
@@ -7,6 +7,7 @@ add-in and the HTML tree view component.
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -15,6 +16,23 @@ if TYPE_CHECKING:
 
 from ...lib import fusionAddInUtils as futil
 from ...models import Bender, UnitConfig
+from ...models.bender import BenderDict
+
+# JSON codec: orjson when it is available, otherwise a compact stdlib encoder.
+# orjson is not bundled with Fusion, so the stdlib path must always work.
+_dumps: Callable[[object], str]
+_loads: Callable[[str], Any]
+try:
+    import orjson
+except ImportError:
+    _dumps = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+    _loads = json.loads
+else:
+    def _orjson_dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _dumps = _orjson_dumps
+    _loads = orjson.loads
 
 
 # Action types for incoming messages (JS -> Python)
@@ -47,12 +65,9 @@ class HTMLMessage:
     die_id: str | None = None
 
     def __repr__(self) -> str:
-        parts = [f"action={self.action!r}"]
-        if self.bender_id:
-            parts.append(f"bender_id={self.bender_id!r}")
-        if self.die_id:
-            parts.append(f"die_id={self.die_id!r}")
-        return f"HTMLMessage({', '.join(parts)})"
+        bender = f", bender_id={self.bender_id!r}" if self.bender_id else ""
+        die = f", die_id={self.die_id!r}" if self.die_id else ""
+        return f"HTMLMessage(action={self.action!r}{bender}{die})"
 
 
 class HTMLBridge:
@@ -78,10 +93,14 @@ class HTMLBridge:
         """
         self._browser_input = browser_input
         self._units = units
+        # Encoded display JSON per bender ID, keyed on the serialized data
+        # it was built from so unchanged benders are not re-encoded
+        self._display_cache: dict[str, tuple[BenderDict, str]] = {}
 
     def set_units(self, units: UnitConfig) -> None:
         """Update the unit configuration."""
         self._units = units
+        self._display_cache.clear()
 
     def parse_message(self, args: 'adsk.core.HTMLEventArgs') -> HTMLMessage:
         """
@@ -98,7 +117,7 @@ class HTMLBridge:
 
         if args.data:
             try:
-                parsed = json.loads(args.data)
+                parsed = _loads(args.data)
                 if isinstance(parsed, dict):
                     data = parsed
                 else:
@@ -121,18 +140,18 @@ class HTMLBridge:
         display_value = value_cm * self._units.cm_to_unit
         return f"{display_value:.2f}{self._units.unit_symbol}"
 
-    def _format_bender_for_display(self, bender: Bender) -> dict[str, Any]:
+    def _format_bender_for_display(self, bender: Bender, bender_dict: BenderDict) -> dict[str, Any]:
         """
         Format a bender for HTML display with converted units.
 
         Args:
             bender: The bender to format
+            bender_dict: Serialized form of the bender (from to_dict)
 
         Returns:
             Dict with bender data plus formatted display strings
         """
         # Convert TypedDict to regular dict so we can add display fields
-        bender_dict = bender.to_dict()
         data: dict[str, Any] = dict(bender_dict)
         # Add formatted display values
         data['min_grip_display'] = self._format_value(bender.min_grip)
@@ -150,6 +169,25 @@ class HTMLBridge:
 
         return data
 
+    def _encode_bender(self, bender: Bender) -> str:
+        """
+        Encode a bender for HTML display, reusing cached JSON when unchanged.
+
+        Args:
+            bender: The bender to encode
+
+        Returns:
+            JSON string of the formatted bender
+        """
+        bender_dict = bender.to_dict()
+        cached = self._display_cache.get(bender.id)
+        if cached is not None and cached[0] == bender_dict:
+            return cached[1]
+
+        encoded = _dumps(self._format_bender_for_display(bender, bender_dict))
+        self._display_cache[bender.id] = (bender_dict, encoded)
+        return encoded
+
     def send_benders(self, benders: list[Bender]) -> None:
         """
         Send the full bender list to the HTML view.
@@ -157,8 +195,7 @@ class HTMLBridge:
         Args:
             benders: List of all benders to display
         """
-        formatted = [self._format_bender_for_display(b) for b in benders]
-        data = json.dumps(formatted)
+        data = '[' + ','.join(self._encode_bender(b) for b in benders) + ']'
         self._browser_input.sendInfoToHTML('loadBenders', data)
 
     def send_bender_added(self, bender: Bender) -> None:
@@ -168,7 +205,7 @@ class HTMLBridge:
         Args:
             bender: The newly created bender
         """
-        data = json.dumps(self._format_bender_for_display(bender))
+        data = self._encode_bender(bender)
         self._browser_input.sendInfoToHTML('addBenderToList', data)
 
     def send_bender_update(self, bender: Bender) -> None:
@@ -178,7 +215,7 @@ class HTMLBridge:
         Args:
             bender: The updated bender
         """
-        data = json.dumps(self._format_bender_for_display(bender))
+        data = self._encode_bender(bender)
         self._browser_input.sendInfoToHTML('updateBender', data)
 
     def send_bender_removed(self, bender_id: str) -> None:
@@ -188,6 +225,7 @@ class HTMLBridge:
         Args:
             bender_id: ID of the removed bender
         """
+        self._display_cache.pop(bender_id, None)
         self._browser_input.sendInfoToHTML('removeBender', bender_id)
 
     def send_die_removed(self, bender_id: str, die_id: str) -> None:
@@ -198,5 +236,5 @@ class HTMLBridge:
             bender_id: ID of the bender containing the die
             die_id: ID of the removed die
         """
-        data = json.dumps({'bender_id': bender_id, 'die_id': die_id})
+        data = _dumps({'bender_id': bender_id, 'die_id': die_id})
         self._browser_input.sendInfoToHTML('removeDie', data)
@@ -5,21 +5,30 @@ from .geometry import (
     dot_product,
     magnitude,
     angle_between_vectors,
+    angle_between_vectors_rad,
     calculate_rotation,
     distance_between_points,
+    squared_distance_between_points,
     points_are_close,
 )
-from .path_analysis import (
+from .geometry_extraction import (
     PathElement,
     PathElementLike,
+    SketchCurveLike,
+    EndpointIndex,
     get_sketch_entity_endpoints,
+    get_cached_sketch_entity_endpoints,
+    clear_endpoint_cache,
     get_component_name,
-    build_ordered_path,
-    validate_path_alternation,
     get_free_endpoint,
+    get_free_endpoints,
     determine_primary_axis,
     should_reverse_path_direction,
 )
+from .path_ordering import (
+    build_ordered_path,
+    validate_path_alternation,
+)
 from .calculations import (
     validate_clr_consistency,
     calculate_straights_and_bends,
@@ -55,19 +64,26 @@ __all__ = [
     'dot_product',
     'magnitude',
     'angle_between_vectors',
+    'angle_between_vectors_rad',
     'calculate_rotation',
     'distance_between_points',
+    'squared_distance_between_points',
     'points_are_close',
     # Path analysis
     'PathElement',
     'PathElementLike',
+    'SketchCurveLike',
     'get_sketch_entity_endpoints',
+    'get_cached_sketch_entity_endpoints',
+    'clear_endpoint_cache',
     'get_component_name',
     'build_ordered_path',
     'validate_path_alternation',
     'get_free_endpoint',
+    'get_free_endpoints',
     'determine_primary_axis',
     'should_reverse_path_direction',
+    'EndpointIndex',
     # Calculations
     'validate_clr_consistency',
     'calculate_straights_and_bends',
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import math
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Protocol
+from typing import Protocol
 
-from ..models.types import Vector3D, Point3D
+from ..models.types import Vector3D, Point3D, SegmentType
 
 
 class ArcLike(Protocol):
@@ -31,19 +31,15 @@ class UnitConfigLike(Protocol):
 from .geometry import (
     cross_product,
     magnitude,
-    angle_between_vectors,
+    angle_between_vectors_rad,
     calculate_rotation,
-    distance_between_points,
+    squared_distance_between_points,
     ZERO_MAGNITUDE_TOLERANCE,
 )
-from .path_analysis import get_sketch_entity_endpoints
+from .geometry_extraction import SketchCurveLike, get_sketch_entity_endpoints
 from .tolerances import CLR_RATIO, CLR_MIN_FLOOR
 
-if TYPE_CHECKING:
-    import adsk.fusion
-
 from ..models.bend_data import StraightSection, BendData, PathSegment, MarkPosition
-from ..models.units import UnitConfig
 
 # Re-export for backward compatibility
 CLR_TOLERANCE_RATIO: float = CLR_RATIO
@@ -63,11 +59,9 @@ def validate_clr_consistency(
     Returns:
         Tuple of (primary_clr, has_mismatch, all_clr_values) in display units
     """
-    clr_values: list[float] = []
-    for arc in arcs:
-        # arc.radius is in cm (Fusion internal)
-        clr_display = arc.radius * units.cm_to_unit
-        clr_values.append(clr_display)
+    # arc.radius is in cm (Fusion internal)
+    cm_to_unit = units.cm_to_unit
+    clr_values: list[float] = [arc.radius * cm_to_unit for arc in arcs]
 
     if not clr_values:
         return 0.0, False, []
@@ -79,24 +73,27 @@ def validate_clr_consistency(
     if math.isnan(clr) or math.isinf(clr) or clr <= 0:
         return 0.0, True, clr_values
 
-    # Check if any values in the list are invalid
-    if any(math.isnan(c) or math.isinf(c) for c in clr_values):
-        return clr, True, clr_values
-
     # Use ratio-based tolerance (0.2% of CLR) with minimum floor
     # The minimum floor prevents false mismatches with very small CLR values
     tolerance = max(clr * CLR_TOLERANCE_RATIO, CLR_MIN_FLOOR)
-    has_mismatch = any(abs(c - clr) > tolerance for c in clr_values)
+
+    # Single pass over the values against a precomputed band, one chained
+    # comparison per value. NaN fails any comparison and infinity falls
+    # outside the band, so invalid values also count as a mismatch
+    low = clr - tolerance
+    high = clr + tolerance
+    has_mismatch = not all(low <= c <= high for c in clr_values)
 
     return clr, has_mismatch, clr_values
 
 
 def calculate_straights_and_bends(
-    lines: list['adsk.fusion.SketchLine'],
-    arcs: list['adsk.fusion.SketchArc'],
+    lines: Sequence[SketchCurveLike],
+    arcs: Sequence[ArcLike],
     path_start: Point3D,
     clr: float,
-    units: UnitConfig
+    units: UnitConfigLike,
+    line_endpoints: Sequence[tuple[Point3D, Point3D]] | None = None,
 ) -> tuple[list[StraightSection], list[BendData]]:
     """
     Calculate all straight sections and bend data from geometry.
@@ -107,103 +104,91 @@ def calculate_straights_and_bends(
         path_start: The starting point of the path (in cm)
         clr: Center line radius in display units
         units: Unit configuration for conversion
+        line_endpoints: Endpoints already extracted for each line (e.g. from
+            PathElement.endpoints). When omitted they are read from the lines.
         
     Returns:
         Tuple of (straights, bends) with lengths in display units
     """
-    # Get line endpoints and orient them correctly
-    line_points: list[tuple[Point3D, Point3D]] = []
-    for line in lines:
-        start, end = get_sketch_entity_endpoints(line)
-        line_points.append((start, end))
+    # Get line endpoints once (each lookup is a Fusion API round-trip),
+    # reusing endpoints the caller already extracted when available
+    line_points: Sequence[tuple[Point3D, Point3D]] = (
+        line_endpoints if line_endpoints is not None
+        else [get_sketch_entity_endpoints(line) for line in lines]
+    )
 
     # Validate we have geometry to process
     if not line_points:
         raise ValueError("No lines provided - cannot calculate bend data")
 
-    # Orient first line so start is at path_start
+    # Each bend requires two adjacent vectors (incoming and outgoing)
+    if len(line_points) < len(arcs) + 1:
+        raise ValueError(
+            f"Insufficient vectors ({len(line_points)}) for {len(arcs)} arcs - "
+            "expected at least arcs + 1 vectors"
+        )
+
+    # Orient each line so its start is nearest the previous line's end
+    # (the first line is oriented against path_start). Squared distances
+    # give the same ordering as distances without the square roots.
     corrected: list[tuple[Point3D, Point3D]] = []
-    first_start, first_end = line_points[0]
-    
-    if distance_between_points(first_end, path_start) < distance_between_points(first_start, path_start):
-        corrected.append((first_end, first_start))
-    else:
-        corrected.append((first_start, first_end))
-    
-    # Orient remaining lines based on connectivity
-    for i in range(1, len(line_points)):
-        prev_end = corrected[i - 1][1]
-        curr_start, curr_end = line_points[i]
-        
-        if distance_between_points(curr_end, prev_end) < distance_between_points(curr_start, prev_end):
-            corrected.append((curr_end, curr_start))
-        else:
-            corrected.append((curr_start, curr_end))
-    
-    # Build straight sections
+    prev_end = path_start
+    for start, end in line_points:
+        if squared_distance_between_points(end, prev_end) < squared_distance_between_points(start, prev_end):
+            start, end = end, start
+        corrected.append((start, end))
+        prev_end = end
+
+    # Build straight sections, vectors and lengths in a single pass
+    cm_to_unit = units.cm_to_unit
     straights: list[StraightSection] = []
     vectors: list[Vector3D] = []
-    
+
     for i, (start, end) in enumerate(corrected):
         vector: Vector3D = (end[0] - start[0], end[1] - start[1], end[2] - start[2])
-        vectors.append(vector)
-        
         length_cm = magnitude(vector)
-        length_display = length_cm * units.cm_to_unit
-        
-        straights.append(StraightSection(
-            number=i + 1,
-            length=length_display,
-            start=(
-                start[0] * units.cm_to_unit,
-                start[1] * units.cm_to_unit,
-                start[2] * units.cm_to_unit
-            ),
-            end=(
-                end[0] * units.cm_to_unit,
-                end[1] * units.cm_to_unit,
-                end[2] * units.cm_to_unit
-            ),
-            vector=vector
-        ))
-    
-    # Calculate bend plane normals
-    # Each bend requires two adjacent vectors (incoming and outgoing)
-    if len(vectors) < len(arcs) + 1:
-        raise ValueError(
-            f"Insufficient vectors ({len(vectors)}) for {len(arcs)} arcs - "
-            "expected at least arcs + 1 vectors"
-        )
 
-    # Validate all vectors are non-zero (zero-length lines cannot define bend planes)
-    for i, v in enumerate(vectors):
-        if magnitude(v) < ZERO_MAGNITUDE_TOLERANCE:
+        # Zero-length lines cannot define bend planes
+        if length_cm < ZERO_MAGNITUDE_TOLERANCE:
             raise ValueError(
                 f"Line {i + 1} has zero length - cannot calculate bend plane"
             )
 
-    normals: list[Vector3D] = []
-    for i in range(len(arcs)):
-        n = cross_product(vectors[i], vectors[i + 1])
-        normals.append(n)
-    
-    # Calculate bend angles and rotations
+        vectors.append(vector)
+        straights.append(StraightSection(
+            number=i + 1,
+            length=length_cm * cm_to_unit,
+            start=(start[0] * cm_to_unit, start[1] * cm_to_unit, start[2] * cm_to_unit),
+            end=(end[0] * cm_to_unit, end[1] * cm_to_unit, end[2] * cm_to_unit),
+            vector=vector
+        ))
+
+    # Calculate bend angles, plane normals and rotations in a single pass.
+    # Each bend plane normal is only needed by the next bend's rotation.
     bends: list[BendData] = []
+    prev_normal: Vector3D | None = None
     for i in range(len(arcs)):
-        bend_angle = angle_between_vectors(vectors[i], vectors[i + 1])
-        arc_length = clr * math.radians(bend_angle)
-        
+        incoming = vectors[i]
+        outgoing = vectors[i + 1]
+
+        # Arc length needs radians; convert to degrees only for display
+        angle_rad = angle_between_vectors_rad(incoming, outgoing)
+        bend_angle = math.degrees(angle_rad)
+        arc_length = clr * angle_rad
+
+        normal = cross_product(incoming, outgoing)
         rotation: float | None = None
-        if i > 0:
-            rotation = calculate_rotation(normals[i - 1], normals[i])
-        
+        if prev_normal is not None:
+            rotation = calculate_rotation(prev_normal, normal)
+        prev_normal = normal
+
         bends.append(BendData(
             number=i + 1,
             angle=bend_angle,
             rotation=rotation,
             arc_length=arc_length
         ))
-    
+
     return straights, bends
 
 
@@ -212,7 +197,7 @@ def build_segments_and_marks(
     bends: list[BendData],
     extra_material: float,
     die_offset: float,
-) -> tuple[list[PathSegment], list[MarkPosition]]:
+) -> tuple[list[PathSegment], list[MarkPosition], float]:
     """
     Build cumulative path segments and mark positions.
 
@@ -223,62 +208,67 @@ def build_segments_and_marks(
         die_offset: Die offset in display units
 
     Returns:
-        Tuple of (segments, mark_positions)
+        Tuple of (segments, mark_positions, total_centerline), where
+        total_centerline is the summed length of every straight and bend
+        segment, excluding extra_material
 
     Note:
         Die offset moves the mark toward the straight section before the bend.
         The mark position is always measured from the start of the tube.
     """
     segments: list[PathSegment] = []
+    append_segment = segments.append
+    n_bends = len(bends)
     cumulative = extra_material
-    
+    centerline = 0.0
+    # Start position of each bend, recorded while building segments.
+    # Bends without a preceding straight have no segment and stay at 0.0.
+    bend_starts: list[float] = [0.0] * n_bends
+
     for i, straight in enumerate(straights):
+        bend = bends[i] if i < n_bends else None
+
         # Add straight segment
-        segments.append(PathSegment(
-            segment_type='straight',
+        straight_end = cumulative + straight.length
+        append_segment(PathSegment(
+            segment_type=SegmentType.STRAIGHT,
             name=f'Straight {straight.number}',
             length=straight.length,
             starts_at=cumulative,
-            ends_at=cumulative + straight.length,
+            ends_at=straight_end,
             bend_angle=None,
-            rotation=bends[i].rotation if i < len(bends) else None
+            rotation=bend.rotation if bend is not None else None
         ))
-        cumulative += straight.length
-        
+        cumulative = straight_end
+        centerline += straight.length
+
         # Add bend segment (if not last straight)
-        if i < len(bends):
-            bend = bends[i]
-            segments.append(PathSegment(
-                segment_type='bend',
+        if bend is not None:
+            bend_starts[i] = cumulative
+            bend_end = cumulative + bend.arc_length
+            append_segment(PathSegment(
+                segment_type=SegmentType.BEND,
                 name=f'BEND {bend.number}',
                 length=bend.arc_length,
                 starts_at=cumulative,
-                ends_at=cumulative + bend.arc_length,
+                ends_at=bend_end,
                 bend_angle=bend.angle,
                 rotation=None
             ))
-            cumulative += bend.arc_length
-    
-    # Calculate mark positions
-    mark_positions: list[MarkPosition] = []
-    for bend in bends:
-        # Find where this bend starts
-        bend_starts_at = 0.0
-        for seg in segments:
-            if seg.segment_type == 'bend' and seg.name == f'BEND {bend.number}':
-                bend_starts_at = seg.starts_at
-                break
-        
-        # Die offset moves mark toward the straight before the bend.
-        # This is always a subtraction since mark_position is measured from
-        # the start of the tube (as laid out in the bend sheet).
-        adjusted_mark = bend_starts_at - die_offset
-
-        mark_positions.append(MarkPosition(
+            cumulative = bend_end
+            centerline += bend.arc_length
+
+    # Die offset moves mark toward the straight before the bend.
+    # This is always a subtraction since mark_position is measured from
+    # the start of the tube (as laid out in the bend sheet).
+    mark_positions: list[MarkPosition] = [
+        MarkPosition(
             bend_num=bend.number,
-            mark_position=adjusted_mark,
+            mark_position=bend_starts[i] - die_offset,
             bend_angle=bend.angle,
             rotation=bend.rotation
-        ))
-    
-    return segments, mark_positions
+        )
+        for i, bend in enumerate(bends)
+    ]
+
+    return segments, mark_positions, centerline
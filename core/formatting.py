@@ -3,9 +3,20 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Callable
+from functools import lru_cache
 
 from ..models.units import UnitConfig
 
+# Labels for the standard imperial precision denominators
+_IMPERIAL_PRECISION_LABELS: dict[int, str] = {
+    0: 'Exact (decimal)',
+    4: '1/4"',
+    8: '1/8"',
+    16: '1/16"',
+    32: '1/32"'
+}
+
 
 def gcd(a: int, b: int) -> int:
     """Calculate greatest common divisor using Euclidean algorithm."""
@@ -47,14 +58,28 @@ def decimal_to_fraction(value: float, denominator: int) -> str:
     
     if numerator == 0:
         return f"{whole}"
-    
-    common: int = gcd(numerator, denominator)
-    num_simplified: int = numerator // common
-    denom_simplified: int = denominator // common
-    
+
+    fraction = _simplified_fraction(numerator, denominator)
     if whole == 0:
-        return f"{num_simplified}/{denom_simplified}"
-    return f"{whole} {num_simplified}/{denom_simplified}"
+        return fraction
+    return f"{whole} {fraction}"
+
+
+@lru_cache(maxsize=128)
+def _simplified_fraction(numerator: int, denominator: int) -> str:
+    """Reduce numerator/denominator to lowest terms, e.g. (4, 16) -> "1/4".
+
+    Only a handful of distinct fractions exist per denominator, so results
+    are cached across the many lengths formatted for a bend sheet.
+    """
+    common: int = gcd(numerator, denominator)
+    return f"{numerator // common}/{denominator // common}"
+
+
+@lru_cache(maxsize=16)
+def _fixed_point_formatter(decimal_places: int) -> Callable[[float], str]:
+    """Return a cached formatter for a fixed number of decimal places."""
+    return f"{{:.{decimal_places}f}}".format
 
 
 def format_metric(value: float, decimal_places: int) -> str:
@@ -82,7 +107,7 @@ def format_metric(value: float, decimal_places: int) -> str:
         else:
             return f"{value:.1f}"
     else:
-        return f"{value:.{decimal_places}f}"
+        return _fixed_point_formatter(decimal_places)(value)
 
 
 def format_length(value: float, precision: int, units: UnitConfig) -> str:
@@ -105,21 +130,20 @@ def format_length(value: float, precision: int, units: UnitConfig) -> str:
 
 def get_precision_label(precision: int, units: UnitConfig) -> str:
     """Get human-readable label for precision value."""
-    if units.is_metric:
+    return _precision_label(precision, units.is_metric, units.unit_symbol)
+
+
+@lru_cache(maxsize=32)
+def _precision_label(precision: int, is_metric: bool, unit_symbol: str) -> str:
+    """Build the precision label; cached since only a few combinations exist."""
+    if is_metric:
         if precision == 0:
             return 'Auto'
         elif precision == 1:
-            return f'0.1{units.unit_symbol}'
+            return f'0.1{unit_symbol}'
         elif precision == 2:
-            return f'0.01{units.unit_symbol}'
+            return f'0.01{unit_symbol}'
         else:
             return f'{precision} decimal places'
     else:
-        labels: dict[int, str] = {
-            0: 'Exact (decimal)',
-            4: '1/4"',
-            8: '1/8"',
-            16: '1/16"',
-            32: '1/32"'
-        }
-        return labels.get(precision, f"1/{precision}\"")
+        return _IMPERIAL_PRECISION_LABELS.get(precision, f"1/{precision}\"")
@@ -92,16 +92,16 @@ def _safe_magnitude_product(v1: Vector3D, v2: Vector3D) -> float:
     return mag1 * mag2
 
 
-def angle_between_vectors(v1: Vector3D, v2: Vector3D) -> float:
+def angle_between_vectors_rad(v1: Vector3D, v2: Vector3D) -> float:
     """
-    Calculate the angle between two vectors in degrees.
+    Calculate the angle between two vectors in radians.
 
     Args:
         v1: First vector
         v2: Second vector
 
     Returns:
-        Angle in degrees (0-180)
+        Angle in radians (0-pi)
 
     Raises:
         ZeroVectorError: If either vector has zero length
@@ -109,7 +109,24 @@ def angle_between_vectors(v1: Vector3D, v2: Vector3D) -> float:
     mag_product = _safe_magnitude_product(v1, v2)
     cos_angle: float = dot_product(v1, v2) / mag_product
     cos_angle = max(-1.0, min(1.0, cos_angle))  # Clamp for floating point errors
-    return math.degrees(math.acos(cos_angle))
+    return math.acos(cos_angle)
+
+
+def angle_between_vectors(v1: Vector3D, v2: Vector3D) -> float:
+    """
+    Calculate the angle between two vectors in degrees.
+
+    Args:
+        v1: First vector
+        v2: Second vector
+
+    Returns:
+        Angle in degrees (0-180)
+
+    Raises:
+        ZeroVectorError: If either vector has zero length
+    """
+    return math.degrees(angle_between_vectors_rad(v1, v2))
 
 
 def calculate_rotation(n1: Vector3D, n2: Vector3D) -> float:
@@ -152,6 +169,26 @@ def distance_between_points(p1: Point3D, p2: Point3D) -> float:
     )
 
 
+def squared_distance_between_points(p1: Point3D, p2: Point3D) -> float:
+    """
+    Calculate the squared Euclidean distance between two 3D points.
+
+    Use this instead of distance_between_points() when only comparing
+    distances, since it avoids the square root.
+
+    Args:
+        p1: First point (x, y, z)
+        p2: Second point (x, y, z)
+
+    Returns:
+        Squared distance between points
+    """
+    dx = p2[0] - p1[0]
+    dy = p2[1] - p1[1]
+    dz = p2[2] - p1[2]
+    return dx * dx + dy * dy + dz * dz
+
+
 def points_are_close(p1: Point3D, p2: Point3D,
                      tolerance: float = CONNECTIVITY_TOLERANCE_CM) -> bool:
     """
@@ -165,4 +202,5 @@ def points_are_close(p1: Point3D, p2: Point3D,
     Returns:
         True if points are within or equal to tolerance distance
     """
-    return distance_between_points(p1, p2) <= tolerance
+    # Compare squared values to skip the square root
+    return squared_distance_between_points(p1, p2) <= tolerance * tolerance
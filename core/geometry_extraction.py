@@ -6,12 +6,14 @@ Fusion 360 sketch entities (lines and arcs).
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Protocol, TypeAlias
 
 from ..models.types import Point3D, ElementType
 from .geometry import points_are_close
+from .tolerances import CONNECTIVITY_CM
 
 if TYPE_CHECKING:
     import adsk.fusion
@@ -34,9 +36,39 @@ class PathElementLike(Protocol):
     def endpoints(self) -> tuple[Point3D, Point3D]: ...
 
 
-def get_sketch_entity_endpoints(
-    entity: 'adsk.fusion.SketchLine | adsk.fusion.SketchArc',
-) -> tuple[Point3D, Point3D]:
+class _PointLike(Protocol):
+    @property
+    def x(self) -> float: ...
+
+    @property
+    def y(self) -> float: ...
+
+    @property
+    def z(self) -> float: ...
+
+
+class _SketchPointLike(Protocol):
+    @property
+    def worldGeometry(self) -> _PointLike: ...
+
+
+class SketchCurveLike(Protocol):
+    """Protocol for sketch lines/arcs as read for their endpoints.
+
+    Satisfied by adsk.fusion.SketchLine and SketchArc, and by test mocks.
+    """
+
+    @property
+    def entityToken(self) -> str: ...
+
+    @property
+    def startSketchPoint(self) -> _SketchPointLike: ...
+
+    @property
+    def endSketchPoint(self) -> _SketchPointLike: ...
+
+
+def get_sketch_entity_endpoints(entity: SketchCurveLike) -> tuple[Point3D, Point3D]:
     """
     Extract world-space endpoints from a sketch entity.
 
@@ -54,6 +86,39 @@ def get_sketch_entity_endpoints(
     )
 
 
+# Endpoints keyed by entityToken. Sketch geometry cannot change while a
+# command dialog is open, so commands clear this when they start and end and
+# reuse entries across the re-validations in between.
+_endpoint_cache: dict[str, tuple[Point3D, Point3D]] = {}
+
+
+def clear_endpoint_cache() -> None:
+    """Forget all cached entity endpoints."""
+    _endpoint_cache.clear()
+
+
+def get_cached_sketch_entity_endpoints(entity: SketchCurveLike) -> tuple[Point3D, Point3D]:
+    """
+    Extract world-space endpoints, reusing earlier results for the same entity.
+
+    Reading entityToken is one API call, versus several for the sketch points
+    and their world geometry. Call clear_endpoint_cache() whenever the
+    geometry may have changed.
+
+    Args:
+        entity: A SketchLine or SketchArc
+
+    Returns:
+        Tuple of (start_point, end_point) in world coordinates (cm)
+    """
+    token = entity.entityToken
+    endpoints = _endpoint_cache.get(token)
+    if endpoints is None:
+        endpoints = get_sketch_entity_endpoints(entity)
+        _endpoint_cache[token] = endpoints
+    return endpoints
+
+
 def get_component_name(entity: 'adsk.fusion.SketchLine | adsk.fusion.SketchArc') -> str:
     """
     Extract the parent component name from a sketch entity.
@@ -66,8 +131,10 @@ def get_component_name(entity: 'adsk.fusion.SketchLine | adsk.fusion.SketchArc')
     """
     try:
         parent_sketch = entity.parentSketch
-        if parent_sketch and parent_sketch.parentComponent:
-            return parent_sketch.parentComponent.name
+        # Read parentComponent once; each property access is an API round-trip
+        component = parent_sketch.parentComponent if parent_sketch else None
+        if component:
+            return component.name
     except Exception as e:
         # Log but don't fail - component name is optional for bend sheet
         try:
@@ -79,29 +146,241 @@ def get_component_name(entity: 'adsk.fusion.SketchLine | adsk.fusion.SketchArc')
     return ""
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, eq=False)
 class PathElement:
-    """Wrapper for a path element (line or arc) with metadata."""
+    """Wrapper for a path element (line or arc) with metadata.
+
+    Compared and hashed by identity (eq=False): two wrappers are the same
+    element only if they are the same object, as with Fusion entities.
+    """
 
     element_type: ElementType
     entity: 'adsk.fusion.SketchLine | adsk.fusion.SketchArc'
     endpoints: tuple[Point3D, Point3D] = field(init=False)
 
     def __post_init__(self) -> None:
-        self.endpoints = get_sketch_entity_endpoints(self.entity)
+        # Frozen dataclass: derived field must be set via object.__setattr__
+        object.__setattr__(
+            self, 'endpoints', get_cached_sketch_entity_endpoints(self.entity)
+        )
 
 
-def get_free_endpoint(element: PathElementLike, all_elements: Sequence[PathElementLike]) -> Point3D:
-    """Get the endpoint of an element that doesn't connect to any other element."""
-    for ep in element.endpoints:
-        connected = False
-        for other in all_elements:
-            if other is element:
+# Offsets of a cell and its 26 neighbors in the endpoint grid
+_NEIGHBOR_OFFSETS: tuple[tuple[int, int, int], ...] = tuple(
+    (dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+)
+
+
+class EndpointIndex:
+    """Spatial hash of path element endpoints for connectivity lookups.
+
+    Endpoints are bucketed into cubic cells one tolerance wide, so any point
+    within tolerance of a query point lies in the query's cell or one of its
+    26 neighbors. Building the index is O(N) and each lookup only compares
+    against the few endpoints in those cells, instead of scanning every
+    element.
+
+    Endpoints whose cell cannot be computed (NaN, infinite, or too large to
+    scale) go into a single overflow bucket instead. Every lookup also checks
+    that bucket, and lookups for such points fall back to a full scan, so
+    malformed geometry degrades to slower lookups rather than an exception.
+    """
+
+    __slots__ = ('_cells', '_inv_cell', '_overflow', '_tolerance_sq')
+
+    def __init__(
+        self,
+        elements: Sequence[PathElementLike] = (),
+        tolerance: float = CONNECTIVITY_CM,
+    ) -> None:
+        """
+        Build the index over all endpoints of the given elements.
+
+        Args:
+            elements: Path elements to index (indices refer to this sequence);
+                more can be added later with add()
+            tolerance: Maximum distance for two endpoints to be connected
+
+        Raises:
+            ValueError: If tolerance is not positive
+        """
+        if tolerance <= 0:
+            raise ValueError(f"Tolerance must be positive, got {tolerance}")
+
+        self._tolerance_sq = tolerance * tolerance
+        self._inv_cell = 1.0 / tolerance
+        self._cells: dict[tuple[int, int, int], list[tuple[int, Point3D]]] = {}
+        self._overflow: list[tuple[int, Point3D]] = []
+
+        for i, element in enumerate(elements):
+            self.add(i, element)
+
+    def add(self, index: int, element: PathElementLike) -> None:
+        """
+        Insert both endpoints of an element under the given index.
+
+        Args:
+            index: Index reported for this element by indices_near()
+            element: Path element to insert
+        """
+        for point in element.endpoints:
+            self._bucket(self._cell_key(point)).append((index, point))
+
+    def insert(self, index: int, element: PathElementLike) -> set[int]:
+        """
+        Find elements already indexed that touch this element, then add it.
+
+        Equivalent to indices_near() on both endpoints followed by add(), but
+        each endpoint's cell key is computed only once.
+
+        Args:
+            index: Index reported for this element by later lookups
+            element: Path element to insert
+
+        Returns:
+            Indices of previously added elements sharing an endpoint with it
+        """
+        found: set[int] = set()
+        for point in element.endpoints:
+            key = self._cell_key(point)
+            found |= self._near(key, point)
+            self._bucket(key).append((index, point))
+        found.discard(index)
+        return found
+
+    def _cell_key(self, point: Point3D) -> tuple[int, int, int] | None:
+        """Grid cell of a point, or None if it has no finite cell."""
+        inv = self._inv_cell
+        try:
+            return (
+                math.floor(point[0] * inv),
+                math.floor(point[1] * inv),
+                math.floor(point[2] * inv),
+            )
+        except (ValueError, OverflowError):
+            # NaN raises ValueError; infinities (including finite
+            # coordinates that overflow when scaled) raise OverflowError
+            return None
+
+    def _bucket(self, key: tuple[int, int, int] | None) -> list[tuple[int, Point3D]]:
+        if key is None:
+            return self._overflow
+        return self._cells.setdefault(key, [])
+
+    def indices_near(self, point: Point3D) -> set[int]:
+        """
+        Find elements with an endpoint within tolerance of a point.
+
+        Args:
+            point: Query point
+
+        Returns:
+            Indices of matching elements in the indexed sequence
+        """
+        return self._near(self._cell_key(point), point)
+
+    def _near(self, key: tuple[int, int, int] | None, point: Point3D) -> set[int]:
+        cells = self._cells
+        buckets: list[list[tuple[int, Point3D]] | None]
+        if key is None:
+            # No cell to search around, so compare against everything
+            buckets = list(cells.values())
+        else:
+            cx, cy, cz = key
+            buckets = [cells.get((cx + dx, cy + dy, cz + dz)) for dx, dy, dz in _NEIGHBOR_OFFSETS]
+        if self._overflow:
+            buckets.append(self._overflow)
+
+        px, py, pz = point
+        tolerance_sq = self._tolerance_sq
+        found: set[int] = set()
+        for bucket in buckets:
+            if bucket is None:
                 continue
-            if points_are_close(ep, other.endpoints[0]) or points_are_close(ep, other.endpoints[1]):
-                connected = True
-                break
-        if not connected:
+            # Inlined squared-distance test; this is the hot loop. NaN
+            # distances compare False, so NaN endpoints never match.
+            for i, (ox, oy, oz) in bucket:
+                ex, ey, ez = ox - px, oy - py, oz - pz
+                if ex * ex + ey * ey + ez * ez <= tolerance_sq:
+                    found.add(i)
+        return found
+
+
+def get_free_endpoint(
+    element: PathElementLike,
+    all_elements: Sequence[PathElementLike],
+    index: EndpointIndex | None = None,
+    own_index: int | None = None,
+) -> Point3D:
+    """
+    Get the endpoint of an element that doesn't connect to any other element.
+
+    Args:
+        element: Element whose free endpoint to find
+        all_elements: All elements in the path
+        index: Prebuilt EndpointIndex over all_elements, to share between calls
+        own_index: Position of element within all_elements, if known;
+            otherwise it is searched for
+
+    Returns:
+        The unconnected endpoint, or the first endpoint if both are connected
+    """
+    if index is not None:
+        if own_index is None:
+            # Only the few elements near each endpoint need an identity check
+            for ep in element.endpoints:
+                if all(all_elements[i] is element for i in index.indices_near(ep)):
+                    return ep
+            return element.endpoints[0]
+        return _free_endpoint(element, own_index, index)
+
+    # Index of element within all_elements (-1 if absent, so nothing is skipped)
+    own = own_index
+    if own is None:
+        own = next((i for i, other in enumerate(all_elements) if other is element), -1)
+
+    # Without a shared index, check the elements beside it in the sequence
+    # first. In an ordered path an endpoint touching one of them is
+    # connected, so only endpoints that look free need the full scan.
+    adjacent = [
+        all_elements[j] for j in (own - 1, own + 1)
+        if own >= 0 and 0 <= j < len(all_elements)
+    ]
+    for ep in element.endpoints:
+        if any(_touches(ep, other) for other in adjacent):
+            continue
+        if not any(other is not element and _touches(ep, other) for other in all_elements):
+            return ep
+    return element.endpoints[0]
+
+
+def get_free_endpoints(elements: Sequence[PathElementLike]) -> list[Point3D]:
+    """
+    Get the free endpoint of every element in a chain.
+
+    Equivalent to calling get_free_endpoint() for each element, but builds a
+    single EndpointIndex and needs no per-element position search.
+
+    Args:
+        elements: All elements in the path
+
+    Returns:
+        Free endpoint for each element, in the same order as elements
+    """
+    index = EndpointIndex(elements)
+    return [_free_endpoint(element, i, index) for i, element in enumerate(elements)]
+
+
+def _touches(point: Point3D, element: PathElementLike) -> bool:
+    """Check if a point is within tolerance of either endpoint of an element."""
+    start, end = element.endpoints
+    return points_are_close(point, start) or points_are_close(point, end)
+
+
+def _free_endpoint(element: PathElementLike, own: int, index: EndpointIndex) -> Point3D:
+    """Return the first endpoint touching no element but the one at index own."""
+    for ep in element.endpoints:
+        if not index.indices_near(ep) - {own}:
             return ep
     return element.endpoints[0]
 
@@ -131,6 +410,26 @@ def should_reverse_path_direction(
     return displacement < 0
 
 
+# Axis name and (negative, positive) direction names, indexed by axis index,
+# for Fusion 360's coordinate system.
+# When looking at Front view: -Z goes toward you, +Z goes away
+_AXIS_DIRECTION_NAMES: tuple[tuple[str, str, str], ...] = (
+    ('X', 'Left', 'Right'),    # -X is Left, +X is Right
+    ('Y', 'Bottom', 'Top'),    # -Y is Bottom, +Y is Top
+    ('Z', 'Front', 'Back'),    # -Z is Front, +Z is Back
+)
+
+# Every possible determine_primary_axis() result, indexed by
+# [axis_index][travels_positive], so calls return a shared tuple.
+_PRIMARY_AXIS_RESULTS: tuple[tuple[tuple[str, int, str, str], tuple[str, int, str, str]], ...] = tuple(
+    (
+        (axis, idx, neg_name, pos_name),
+        (axis, idx, pos_name, neg_name),
+    )
+    for idx, (axis, neg_name, pos_name) in enumerate(_AXIS_DIRECTION_NAMES)
+)
+
+
 def determine_primary_axis(start: Point3D, end: Point3D) -> tuple[str, int, str, str]:
     """
     Determine the primary travel axis and direction.
@@ -146,31 +445,17 @@ def determine_primary_axis(start: Point3D, end: Point3D) -> tuple[str, int, str,
         - Y axis: Front (-Y) / Back (+Y)
         - Z axis: Bottom (-Z) / Top (+Z)
     """
-    displacement = (end[0] - start[0], end[1] - start[1], end[2] - start[2])
-    abs_disp = (abs(displacement[0]), abs(displacement[1]), abs(displacement[2]))
-    max_disp = max(abs_disp)
-
-    # Direction name mappings for Fusion 360's coordinate system
-    # When looking at Front view: -Z goes toward you, +Z goes away
-    direction_names: dict[str, tuple[str, str]] = {
-        'X': ('Left', 'Right'),    # -X is Left, +X is Right
-        'Y': ('Bottom', 'Top'),    # -Y is Bottom, +Y is Top
-        'Z': ('Front', 'Back'),    # -Z is Front, +Z is Back
-    }
-
-    if abs_disp[0] == max_disp:
-        axis, idx = 'X', 0
-    elif abs_disp[1] == max_disp:
-        axis, idx = 'Y', 1
-    else:
-        axis, idx = 'Z', 2
-
-    neg_name, pos_name = direction_names[axis]
-    if displacement[idx] > 0:
-        current = pos_name
-        opposite = neg_name
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    dz = end[2] - start[2]
+    ax, ay, az = abs(dx), abs(dy), abs(dz)
+
+    # Ties resolve in X, Y, Z order
+    if ax >= ay and ax >= az:
+        idx, d = 0, dx
+    elif ay >= az:
+        idx, d = 1, dy
     else:
-        current = neg_name
-        opposite = pos_name
+        idx, d = 2, dz
 
-    return axis, idx, current, opposite
+    return _PRIMARY_AXIS_RESULTS[idx][d > 0]
@@ -108,19 +108,15 @@ def calculate_material_requirements(
         extra_material = synthetic_grip_material
 
     # Validate straight sections against min_grip (all except last)
-    grip_violations: list[int] = []
-    if min_grip > 0 and len(straights) > 1:
-        sections_to_check = straights[:-1]  # All except the last one
-        for straight in sections_to_check:
-            if straight.length < min_grip:
-                grip_violations.append(straight.number)
+    grip_violations: list[int] = (
+        [s.number for s in straights[:-1] if s.length < min_grip]
+        if min_grip > 0 and len(straights) > 1
+        else []
+    )
 
     # Validate last straight section against min_tail
-    tail_violation: bool = False
-    if min_tail > 0 and len(straights) > 0:
-        last_straight = straights[-1]
-        if last_straight.length < min_tail:
-            tail_violation = True
+    # (straights is known to be non-empty here)
+    tail_violation: bool = min_tail > 0 and straights[-1].length < min_tail
 
     return MaterialCalculation(
         extra_material=extra_material,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import html as html_lib
 
 from ..models.bend_data import BendSheetData
+from ..models.types import SegmentType
 from .formatting import format_length, get_precision_label
 
 
@@ -148,9 +149,10 @@ def _generate_bend_table(data: BendSheetData) -> str:
     last_straight_num = len(data.straights)
     for i, seg in enumerate(data.segments):
         # Check if this is a straight section with grip or tail violation
+        is_bend = seg.segment_type is SegmentType.BEND
         is_grip_warning = False
         is_tail_warning = False
-        if seg.segment_type == 'straight':
+        if not is_bend:
             # Extract section number from name (e.g., "Straight 1" -> 1)
             try:
                 section_num = int(seg.name.split()[-1])
@@ -160,14 +162,14 @@ def _generate_bend_table(data: BendSheetData) -> str:
                 pass
 
         # Determine row class
-        if seg.segment_type == 'bend':
+        if is_bend:
             row_class = ' class="bend-row"'
         elif is_grip_warning or is_tail_warning:
             row_class = ' class="grip-warning"'
         else:
             row_class = ''
 
-        if seg.segment_type == 'bend':
+        if is_bend:
             angle_str = f"{seg.bend_angle:.1f}°"
             rot_str = "—"
         else:
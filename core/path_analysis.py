@@ -2,31 +2,53 @@
 
 DEPRECATED: This module re-exports from geometry_extraction and path_ordering
 for backward compatibility. New code should import directly from those modules.
+
+Names are resolved lazily (PEP 562), so importing this module does not pull
+in either implementation module until an attribute is actually used. The
+DeprecationWarning is raised on that first use of each name, so it points at
+the caller's import or attribute access rather than at importlib internals.
 """
 
-from typing import TYPE_CHECKING
-
-from .geometry_extraction import (
-    get_sketch_entity_endpoints,
-    get_component_name,
-    PathElement,
-    PathElementLike,
-    get_free_endpoint,
-    determine_primary_axis,
-    should_reverse_path_direction,
-)
-from .path_ordering import (
-    elements_are_connected,
-    build_ordered_path,
-    validate_path_alternation,
-)
+from __future__ import annotations
+
+import importlib
+import warnings
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .geometry_extraction import SketchEntity as SketchEntity  # noqa: F401
+    from .geometry_extraction import (  # noqa: F401
+        get_sketch_entity_endpoints as get_sketch_entity_endpoints,
+        get_component_name as get_component_name,
+        PathElement as PathElement,
+        PathElementLike as PathElementLike,
+        get_free_endpoint as get_free_endpoint,
+        determine_primary_axis as determine_primary_axis,
+        should_reverse_path_direction as should_reverse_path_direction,
+    )
+    from .path_ordering import (  # noqa: F401
+        elements_are_connected as elements_are_connected,
+        build_ordered_path as build_ordered_path,
+        validate_path_alternation as validate_path_alternation,
+    )
+
+# Public name -> defining submodule
+_EXPORTS: dict[str, str] = {
+    # Geometry extraction
+    'get_sketch_entity_endpoints': '.geometry_extraction',
+    'get_component_name': '.geometry_extraction',
+    'PathElement': '.geometry_extraction',
+    'PathElementLike': '.geometry_extraction',
+    'get_free_endpoint': '.geometry_extraction',
+    'determine_primary_axis': '.geometry_extraction',
+    'should_reverse_path_direction': '.geometry_extraction',
+    # Path ordering
+    'elements_are_connected': '.path_ordering',
+    'build_ordered_path': '.path_ordering',
+    'validate_path_alternation': '.path_ordering',
+}
 
 __all__ = [
     # Geometry extraction
-    'SketchEntity',
     'get_sketch_entity_endpoints',
     'get_component_name',
     'PathElement',
@@ -39,3 +61,18 @@ __all__ = [
     'build_ordered_path',
     'validate_path_alternation',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    warnings.warn(
+        f"core.path_analysis is deprecated; import {name} from "
+        f"core.{module_name.lstrip('.')} instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
@@ -9,8 +9,9 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import TypeVar
 
+from ..models.types import ElementType
 from .geometry import points_are_close
-from .geometry_extraction import PathElementLike
+from .geometry_extraction import EndpointIndex, PathElementLike
 
 
 # Type variable for preserving element types through functions
@@ -43,13 +44,18 @@ def build_ordered_path(
     if len(elements) < 2:
         return None, "Path must have at least 2 elements (1 straight + 1 bend minimum)."
 
-    # Build adjacency list
-    neighbors: dict[int, list[int]] = {i: [] for i in range(len(elements))}
-    for i in range(len(elements)):
-        for j in range(i + 1, len(elements)):
-            if elements_are_connected(elements[i], elements[j]):
-                neighbors[i].append(j)
-                neighbors[j].append(i)
+    # Build adjacency list in a single pass: each element's endpoints are
+    # looked up among the elements already indexed, then it is inserted, so
+    # every connected pair is found exactly once without testing all pairs.
+    index = EndpointIndex()
+    adjacent: list[set[int]] = [set() for _ in elements]
+    for i, element in enumerate(elements):
+        for j in index.insert(i, element):
+            adjacent[i].add(j)
+            adjacent[j].add(i)
+
+    # Sorted so traversal order is deterministic
+    neighbors: dict[int, list[int]] = {i: sorted(n) for i, n in enumerate(adjacent)}
 
     # Check for disconnected elements
     disconnected = [i for i, n in neighbors.items() if len(n) == 0]
@@ -111,10 +117,11 @@ def validate_path_alternation(path: Sequence[PathElementLike]) -> tuple[bool, st
         return False, "Empty path"
 
     first_type = path[0].element_type
+    other_type = ElementType.ARC if first_type is ElementType.LINE else ElementType.LINE
 
     for i, elem in enumerate(path):
-        expected = first_type if i % 2 == 0 else ('arc' if first_type == 'line' else 'line')
-        if elem.element_type != expected:
-            return False, f"Position {i+1}: expected {expected}, got {elem.element_type}"
+        expected = first_type if i % 2 == 0 else other_type
+        if elem.element_type is not expected:
+            return False, f"Position {i+1}: expected {expected!s}, got {elem.element_type!s}"
 
     return True, ""
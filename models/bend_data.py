@@ -8,7 +8,7 @@ from .types import Vector3D, Point3D, SegmentType
 from .units import UnitConfig
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class StraightSection:
     """Represents a straight section of tube between bends."""
     number: int
@@ -18,7 +18,7 @@ class StraightSection:
     vector: Vector3D  # In internal units (cm) for calculations
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class BendData:
     """Represents a bend in the tube path."""
 
@@ -32,7 +32,7 @@ class BendData:
         return f"BendData(#{self.number}, angle={self.angle:.1f}{rot})"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PathSegment:
     """Represents a segment in the cumulative path table."""
     segment_type: SegmentType
@@ -44,7 +44,7 @@ class PathSegment:
     rotation: float | None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class MarkPosition:
     """Represents a mark position for the bender setup."""
     bend_num: int
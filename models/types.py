@@ -1,17 +1,35 @@
 """Shared type definitions for TubeBendSheet.
 
-This module provides common type aliases and Literal types used
+This module provides common type aliases and enums used
 throughout the codebase to ensure type safety and consistency.
 """
 
-from typing import Literal
+from enum import IntEnum
 
 # 3D coordinate types
 Vector3D = tuple[float, float, float]
 Point3D = tuple[float, float, float]
 
-# Path element types - 'line' for straight sections, 'arc' for bends
-ElementType = Literal["line", "arc"]
 
-# Segment types in the bend sheet output
-SegmentType = Literal["straight", "bend"]
+class ElementType(IntEnum):
+    """Path element types - LINE for straight sections, ARC for bends.
+
+    An IntEnum so hot loops can dispatch with identity checks
+    (``element.element_type is ElementType.LINE``) instead of string compares.
+    """
+
+    LINE = 0
+    ARC = 1
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+class SegmentType(IntEnum):
+    """Segment types in the bend sheet output."""
+
+    STRAIGHT = 0
+    BEND = 1
+
+    def __str__(self) -> str:
+        return self.name.lower()
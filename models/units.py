@@ -17,7 +17,7 @@ DEFAULT_PRECISION_IMPERIAL: int = 16
 DEFAULT_PRECISION_METRIC: int = 1
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class UnitConfig:
     """
     Unit configuration extracted from Fusion design.
@@ -50,63 +50,64 @@ class UnitConfig:
         Returns:
             UnitConfig with appropriate settings for the design's units
         """
-        units_mgr = design.unitsManager
-        default_units = units_mgr.defaultLengthUnits
-        
-        # Map Fusion unit strings to our config
-        unit_configs = {
-            'in': cls(
-                is_metric=False,
-                unit_name='in',
-                unit_symbol='"',
-                cm_to_unit=1.0 / 2.54,
-                default_tube_od='1.75',
-                default_precision=DEFAULT_PRECISION_IMPERIAL,
-                valid_precisions=VALID_PRECISIONS_IMPERIAL
-            ),
-            'ft': cls(
-                is_metric=False,
-                unit_name='ft',
-                unit_symbol="'",
-                cm_to_unit=1.0 / 30.48,
-                default_tube_od='0.146',
-                default_precision=DEFAULT_PRECISION_IMPERIAL,
-                valid_precisions=VALID_PRECISIONS_IMPERIAL
-            ),
-            'mm': cls(
-                is_metric=True,
-                unit_name='mm',
-                unit_symbol='mm',
-                cm_to_unit=10.0,
-                default_tube_od='44.45',
-                default_precision=DEFAULT_PRECISION_METRIC,
-                valid_precisions=VALID_PRECISIONS_METRIC
-            ),
-            'cm': cls(
-                is_metric=True,
-                unit_name='cm',
-                unit_symbol='cm',
-                cm_to_unit=1.0,
-                default_tube_od='4.445',
-                default_precision=DEFAULT_PRECISION_METRIC,
-                valid_precisions=VALID_PRECISIONS_METRIC
-            ),
-            'm': cls(
-                is_metric=True,
-                unit_name='m',
-                unit_symbol='m',
-                cm_to_unit=0.01,
-                default_tube_od='0.04445',
-                default_precision=DEFAULT_PRECISION_METRIC,
-                valid_precisions=VALID_PRECISIONS_METRIC
-            ),
-        }
-        
-        config = unit_configs.get(default_units)
+        default_units = design.unitsManager.defaultLengthUnits
+
+        config = _UNIT_CONFIGS.get(default_units)
         if config is None:
-            supported = ", ".join(sorted(unit_configs.keys()))
+            supported = ", ".join(sorted(_UNIT_CONFIGS))
             raise ValueError(
                 f"Unsupported unit system: '{default_units}'. "
                 f"Supported units: {supported}"
             )
         return config
+
+
+# Map Fusion unit strings to our config. Built once at import; instances are
+# frozen, so every caller can share them.
+_UNIT_CONFIGS: dict[str, UnitConfig] = {
+    'in': UnitConfig(
+        is_metric=False,
+        unit_name='in',
+        unit_symbol='"',
+        cm_to_unit=1.0 / 2.54,
+        default_tube_od='1.75',
+        default_precision=DEFAULT_PRECISION_IMPERIAL,
+        valid_precisions=VALID_PRECISIONS_IMPERIAL
+    ),
+    'ft': UnitConfig(
+        is_metric=False,
+        unit_name='ft',
+        unit_symbol="'",
+        cm_to_unit=1.0 / 30.48,
+        default_tube_od='0.146',
+        default_precision=DEFAULT_PRECISION_IMPERIAL,
+        valid_precisions=VALID_PRECISIONS_IMPERIAL
+    ),
+    'mm': UnitConfig(
+        is_metric=True,
+        unit_name='mm',
+        unit_symbol='mm',
+        cm_to_unit=10.0,
+        default_tube_od='44.45',
+        default_precision=DEFAULT_PRECISION_METRIC,
+        valid_precisions=VALID_PRECISIONS_METRIC
+    ),
+    'cm': UnitConfig(
+        is_metric=True,
+        unit_name='cm',
+        unit_symbol='cm',
+        cm_to_unit=1.0,
+        default_tube_od='4.445',
+        default_precision=DEFAULT_PRECISION_METRIC,
+        valid_precisions=VALID_PRECISIONS_METRIC
+    ),
+    'm': UnitConfig(
+        is_metric=True,
+        unit_name='m',
+        unit_symbol='m',
+        cm_to_unit=0.01,
+        default_tube_od='0.04445',
+        default_precision=DEFAULT_PRECISION_METRIC,
+        valid_precisions=VALID_PRECISIONS_METRIC
+    ),
+}
@@ -5,18 +5,94 @@ This module contains mock classes and utilities used across multiple test files.
 """
 from __future__ import annotations
 
+import sys
+import types
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from pathlib import Path
+from unittest import mock
 
 from models.types import ElementType, Point3D
 
+# Package name the add-in is imported under (see conftest.py)
+PACKAGE = 'TubeBendSheet'
+_PROJECT_ROOT = Path(__file__).parent.parent
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, eq=False)
 class MockPathElement:
     """Mock PathElement for testing without Fusion API.
 
     Satisfies PathElementLike Protocol from core.geometry_extraction.
+    Like PathElement, compares and hashes by identity (eq=False).
     """
 
     element_type: ElementType
     endpoints: tuple[Point3D, Point3D]
     entity: None = None  # Not needed for tests
+
+
+@dataclass(slots=True)
+class MockPoint3D:
+    """Mock Point3D with x, y, z coordinates."""
+
+    x: float
+    y: float
+    z: float
+
+
+class MockSketchPoint:
+    """Mock SketchPoint exposing worldGeometry, counting how often it is read."""
+
+    def __init__(self, point: Point3D) -> None:
+        self._point = MockPoint3D(*point)
+        self.reads = 0
+
+    @property
+    def worldGeometry(self) -> MockPoint3D:
+        self.reads += 1
+        return self._point
+
+
+class MockSketchLine:
+    """Mock SketchLine (or SketchArc) with start/end sketch points and an entityToken."""
+
+    def __init__(self, start: Point3D, end: Point3D, token: str = '') -> None:
+        self.entityToken = token
+        self.startSketchPoint = MockSketchPoint(start)
+        self.endSketchPoint = MockSketchPoint(end)
+
+
+def _stub_package(relative_name: str) -> types.ModuleType:
+    """Namespace stand-in for a package, so its __init__ is not executed."""
+    module = types.ModuleType(f'{PACKAGE}.{relative_name}')
+    module.__path__ = [str(_PROJECT_ROOT.joinpath(*relative_name.split('.')))]
+    return module
+
+
+@contextmanager
+def fusion_stubs(*packages: str) -> Iterator[mock.MagicMock]:
+    """
+    Stub the adsk modules so Fusion-only add-in modules can be imported.
+
+    sys.modules is restored on exit, which also drops any module imported
+    inside the block.
+
+    Args:
+        packages: Add-in packages (e.g. 'commands') to replace with empty
+            namespaces, skipping __init__ files that start Fusion commands
+
+    Yields:
+        The MagicMock installed as the adsk module
+    """
+    adsk = mock.MagicMock()
+    stubs: dict[str, object] = {
+        'adsk': adsk,
+        'adsk.core': adsk.core,
+        'adsk.fusion': adsk.fusion,
+    }
+    for name in packages:
+        stubs[f'{PACKAGE}.{name}'] = _stub_package(name)
+    with mock.patch.dict(sys.modules, stubs):
+        yield adsk
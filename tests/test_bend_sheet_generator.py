@@ -0,0 +1,72 @@
+"""
+Tests for BendSheetGenerator input checks - runs without Fusion.
+
+Run with: pytest tests/ -v
+"""
+from __future__ import annotations
+
+import importlib
+import types
+from collections.abc import Iterator
+from unittest import mock
+
+import pytest
+
+from helpers import PACKAGE, MockPathElement, fusion_stubs
+from models.types import ElementType
+
+
+@pytest.fixture(scope='module')
+def bend_sheet_generator() -> Iterator[types.ModuleType]:
+    """Import the generator module against stubbed adsk modules."""
+    with fusion_stubs('commands'):
+        yield importlib.import_module(f'{PACKAGE}.commands.createBendSheet.bend_sheet_generator')
+
+
+def _generate(module: types.ModuleType, path: list[MockPathElement]):
+    generator = module.BendSheetGenerator(mock.MagicMock())
+    return generator.generate(
+        path,
+        start_point=(0.0, 0.0, 0.0),
+        params=mock.MagicMock(),
+        component_name='Tube',
+        travel_direction='Left to Right',
+        opposite_direction='Right to Left',
+        starts_with_arc=path[0].element_type is ElementType.ARC,
+        ends_with_arc=path[-1].element_type is ElementType.ARC,
+    )
+
+
+class TestGenerateRejectsUnusableGeometry:
+    """generate() fails fast on paths that cannot form a bend sheet."""
+
+    def test_no_lines(self, bend_sheet_generator: types.ModuleType) -> None:
+        """A path of only arcs has no straight sections."""
+        path = [
+            MockPathElement(ElementType.ARC, ((0.0, 0.0, 0.0), (1.0, 1.0, 0.0))),
+            MockPathElement(ElementType.ARC, ((1.0, 1.0, 0.0), (2.0, 0.0, 0.0))),
+        ]
+
+        result = _generate(bend_sheet_generator, path)
+
+        assert result.success is False
+        assert result.data is None
+        assert result.error == "No straight sections found in path. Cannot generate bend sheet."
+
+    def test_insufficient_lines_for_arcs(self, bend_sheet_generator: types.ModuleType) -> None:
+        """Each bend needs a straight on both sides."""
+        path = [
+            MockPathElement(ElementType.ARC, ((0.0, 0.0, 0.0), (1.0, 1.0, 0.0))),
+            MockPathElement(ElementType.LINE, ((1.0, 1.0, 0.0), (5.0, 1.0, 0.0))),
+            MockPathElement(ElementType.ARC, ((5.0, 1.0, 0.0), (6.0, 2.0, 0.0))),
+            MockPathElement(ElementType.LINE, ((6.0, 2.0, 0.0), (6.0, 8.0, 0.0))),
+        ]
+
+        result = _generate(bend_sheet_generator, path)
+
+        assert result.success is False
+        assert result.data is None
+        assert result.error == (
+            "Insufficient straight sections (2) for 2 bend(s). "
+            "Each bend needs a straight section before and after it."
+        )
@@ -3,98 +3,103 @@ Tests for calculations module - runs without Fusion.
 
 Run with: pytest tests/ -v
 """
+import math
 from dataclasses import dataclass
 
-from core.calculations import build_segments_and_marks, validate_clr_consistency
+import pytest
+
+from helpers import MockSketchLine, MockSketchPoint
+from core.calculations import (
+    build_segments_and_marks,
+    calculate_straights_and_bends,
+    validate_clr_consistency,
+)
 from core.direction_validation import (
     validate_grip_for_direction,
     validate_direction_aware,
 )
-from models import BendData, StraightSection
+from models import BendData, MarkPosition, PathSegment, StraightSection
+from models.types import SegmentType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockArc:
     """Mock SketchArc that only provides radius attribute."""
     radius: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockUnitConfig:
     """Mock UnitConfig for testing."""
     cm_to_unit: float = 1.0  # 1:1 for simplicity in tests
 
 
-class TestValidateClrConsistency:
-    """Test CLR validation function."""
+class UnreadableSketchLine:
+    """Sketch line stand-in that fails the test if its geometry is read."""
 
-    # Happy path tests
-    def test_single_arc(self) -> None:
-        arcs = [MockArc(radius=5.0)]
-        units = MockUnitConfig()
-        clr, has_mismatch, values = validate_clr_consistency(arcs, units)
-        assert clr == 5.0
-        assert has_mismatch is False
-        assert values == [5.0]
+    @property
+    def entityToken(self) -> str:
+        raise AssertionError("entityToken was read")
 
-    def test_multiple_matching_arcs(self) -> None:
-        arcs = [MockArc(radius=5.0), MockArc(radius=5.0), MockArc(radius=5.0)]
-        units = MockUnitConfig()
-        clr, has_mismatch, _values = validate_clr_consistency(arcs, units)
-        assert clr == 5.0
-        assert has_mismatch is False
+    @property
+    def startSketchPoint(self) -> MockSketchPoint:
+        raise AssertionError("startSketchPoint was read")
 
-    def test_arcs_within_tolerance(self) -> None:
-        # 0.2% of 5.0 is 0.01, so 5.005 should be within tolerance
-        arcs = [MockArc(radius=5.0), MockArc(radius=5.005)]
-        units = MockUnitConfig()
-        clr, has_mismatch, _values = validate_clr_consistency(arcs, units)
-        assert clr == 5.0
-        assert has_mismatch is False
+    @property
+    def endSketchPoint(self) -> MockSketchPoint:
+        raise AssertionError("endSketchPoint was read")
 
-    def test_arcs_outside_tolerance(self) -> None:
-        # 5.0 and 5.1 differ by 0.1, which is 2% - way outside 0.2% tolerance
-        arcs = [MockArc(radius=5.0), MockArc(radius=5.1)]
-        units = MockUnitConfig()
-        clr, has_mismatch, _values = validate_clr_consistency(arcs, units)
-        assert clr == 5.0
-        assert has_mismatch is True
 
-    # Empty list tests
-    def test_empty_arcs_list(self) -> None:
-        arcs: list[MockArc] = []
-        units = MockUnitConfig()
-        clr, has_mismatch, values = validate_clr_consistency(arcs, units)
-        assert clr == 0.0
-        assert has_mismatch is False
-        assert values == []
+@pytest.fixture(scope="module")
+def units() -> MockUnitConfig:
+    """Shared 1:1 unit config (cm_to_unit = 1.0)."""
+    return MockUnitConfig()
 
-    # Issue 4 fix: Zero/negative CLR tests
-    def test_zero_clr_returns_mismatch(self) -> None:
-        """Zero CLR should return mismatch flag (Issue 4 fix)."""
-        arcs = [MockArc(radius=0.0)]
-        units = MockUnitConfig()
-        clr, has_mismatch, values = validate_clr_consistency(arcs, units)
-        assert clr == 0.0
-        assert has_mismatch is True
-        assert values == [0.0]
-
-    def test_negative_clr_returns_mismatch(self) -> None:
-        """Negative CLR should return mismatch flag (Issue 4 fix)."""
-        arcs = [MockArc(radius=-1.0)]
-        units = MockUnitConfig()
+
+class TestValidateClrConsistency:
+    """Test CLR validation function."""
+
+    @pytest.mark.parametrize(
+        ("radii", "expected_clr", "expected_mismatch"),
+        [
+            # Happy path
+            pytest.param([5.0], 5.0, False, id="single_arc"),
+            pytest.param([5.0, 5.0, 5.0], 5.0, False, id="multiple_matching_arcs"),
+            # 0.2% of 5.0 is 0.01, so 5.005 should be within tolerance
+            pytest.param([5.0, 5.005], 5.0, False, id="within_tolerance"),
+            # 5.0 and 5.1 differ by 0.1, which is 2% - way outside 0.2% tolerance
+            pytest.param([5.0, 5.1], 5.0, True, id="outside_tolerance"),
+            # Empty list
+            pytest.param([], 0.0, False, id="empty_arcs_list"),
+            # Issue 4 fix: zero/negative CLR returns mismatch flag
+            pytest.param([0.0], 0.0, True, id="zero_clr"),
+            pytest.param([-1.0], 0.0, True, id="negative_clr"),
+            pytest.param([0.0, 5.0], 0.0, True, id="first_arc_zero"),
+            # With CLR = 0.01, ratio tolerance = 0.00002 (too small), so the
+            # 0.001 floor applies and a 0.0005 difference is within tolerance
+            pytest.param([0.01, 0.0105], 0.01, False, id="small_clr_uses_tolerance_floor"),
+            # Defensive: NaN and infinity can't be used as a CLR
+            pytest.param([float('nan')], 0.0, True, id="nan_clr"),
+            pytest.param([float('inf')], 0.0, True, id="inf_clr"),
+            # Negative infinity is caught by clr <= 0 check
+            pytest.param([float('-inf')], 0.0, True, id="negative_inf_clr"),
+            pytest.param([5.0, float('nan')], 5.0, True, id="nan_in_later_arc"),
+            pytest.param([5.0, float('inf')], 5.0, True, id="inf_in_later_arc"),
+        ],
+    )
+    def test_clr_and_mismatch(
+        self,
+        units: MockUnitConfig,
+        radii: list[float],
+        expected_clr: float,
+        expected_mismatch: bool,
+    ) -> None:
+        arcs = [MockArc(radius=r) for r in radii]
         clr, has_mismatch, values = validate_clr_consistency(arcs, units)
-        assert clr == 0.0
-        assert has_mismatch is True
-        assert values == [-1.0]
-
-    def test_multiple_arcs_first_zero(self) -> None:
-        """If first arc has zero radius, should return mismatch."""
-        arcs = [MockArc(radius=0.0), MockArc(radius=5.0)]
-        units = MockUnitConfig()
-        clr, has_mismatch, _values = validate_clr_consistency(arcs, units)
-        assert clr == 0.0
-        assert has_mismatch is True
+        assert clr == expected_clr
+        assert has_mismatch is expected_mismatch
+        # All values are returned in display units, even invalid ones
+        assert values == pytest.approx(radii, nan_ok=True)
 
     # Unit conversion tests
     def test_unit_conversion(self) -> None:
@@ -105,42 +110,98 @@ class TestValidateClrConsistency:
         assert abs(clr - 1.0) < 0.0001  # Should be 1 inch
         assert has_mismatch is False
 
-    # Minimum tolerance floor tests
-    def test_very_small_clr_uses_minimum_tolerance(self) -> None:
-        """Very small CLR should use minimum tolerance floor of 0.001."""
-        # With CLR = 0.01, ratio tolerance = 0.00002 (too small)
-        # Should use minimum floor of 0.001 instead
-        arcs = [MockArc(radius=0.01), MockArc(radius=0.0105)]
-        units = MockUnitConfig()
-        clr, has_mismatch, _values = validate_clr_consistency(arcs, units)
-        assert clr == 0.01
-        # 0.0005 difference is within 0.001 tolerance floor
-        assert has_mismatch is False
 
-    # Defensive: NaN and Infinity handling
-    def test_nan_clr_returns_mismatch(self) -> None:
-        """NaN radius should return mismatch flag (defensive behavior)."""
-        arcs = [MockArc(radius=float('nan'))]
-        units = MockUnitConfig()
-        _clr, has_mismatch, _values = validate_clr_consistency(arcs, units)
-        # NaN should trigger mismatch - we can't work with invalid geometry
-        assert has_mismatch is True
-
-    def test_inf_clr_returns_mismatch(self) -> None:
-        """Infinity radius should return mismatch flag (defensive behavior)."""
-        arcs = [MockArc(radius=float('inf'))]
-        units = MockUnitConfig()
-        _clr, has_mismatch, _values = validate_clr_consistency(arcs, units)
-        # Infinity should trigger mismatch - not a valid CLR value
-        assert has_mismatch is True
-
-    def test_negative_inf_clr_returns_mismatch(self) -> None:
-        """Negative infinity should return mismatch flag."""
-        arcs = [MockArc(radius=float('-inf'))]
-        units = MockUnitConfig()
-        _clr, has_mismatch, _values = validate_clr_consistency(arcs, units)
-        # Negative infinity is caught by clr <= 0 check
-        assert has_mismatch is True
+class TestCalculateStraightsAndBends:
+    """Test calculate_straights_and_bends() function."""
+
+    def test_single_bend_lengths_and_angle(self, units: MockUnitConfig) -> None:
+        lines = [
+            MockSketchLine((0.0, 0.0, 0.0), (10.0, 0.0, 0.0)),
+            MockSketchLine((10.0, 0.0, 0.0), (10.0, 5.0, 0.0)),
+        ]
+        straights, bends = calculate_straights_and_bends(
+            lines, [MockArc(radius=2.0)], (0.0, 0.0, 0.0), 2.0, units
+        )
+        assert [s.length for s in straights] == [10.0, 5.0]
+        assert len(bends) == 1
+        assert abs(bends[0].angle - 90.0) < 1e-9
+        assert abs(bends[0].arc_length - math.pi) < 1e-9
+        assert bends[0].rotation is None
+
+    def test_reversed_lines_are_oriented_along_path(self, units: MockUnitConfig) -> None:
+        """Lines drawn backwards are flipped to follow the path."""
+        lines = [
+            MockSketchLine((10.0, 0.0, 0.0), (0.0, 0.0, 0.0)),
+            MockSketchLine((10.0, 5.0, 0.0), (10.0, 0.0, 0.0)),
+        ]
+        straights, _bends = calculate_straights_and_bends(
+            lines, [MockArc(radius=2.0)], (0.0, 0.0, 0.0), 2.0, units
+        )
+        assert straights[0].start == (0.0, 0.0, 0.0)
+        assert straights[0].end == (10.0, 0.0, 0.0)
+        assert straights[1].start == (10.0, 0.0, 0.0)
+        assert straights[1].vector == (0.0, 5.0, 0.0)
+
+    def test_rotation_between_planes(self, units: MockUnitConfig) -> None:
+        lines = [
+            MockSketchLine((0.0, 0.0, 0.0), (10.0, 0.0, 0.0)),
+            MockSketchLine((10.0, 0.0, 0.0), (10.0, 10.0, 0.0)),
+            MockSketchLine((10.0, 10.0, 0.0), (10.0, 10.0, 10.0)),
+        ]
+        _straights, bends = calculate_straights_and_bends(
+            lines, [MockArc(2.0), MockArc(2.0)], (0.0, 0.0, 0.0), 2.0, units
+        )
+        assert bends[1].rotation is not None
+        assert abs(bends[1].rotation - 90.0) < 1e-9
+
+    def test_unit_conversion_applied(self) -> None:
+        lines = [
+            MockSketchLine((0.0, 0.0, 0.0), (10.0, 0.0, 0.0)),
+            MockSketchLine((10.0, 0.0, 0.0), (10.0, 5.0, 0.0)),
+        ]
+        straights, _bends = calculate_straights_and_bends(
+            lines, [MockArc(2.0)], (0.0, 0.0, 0.0), 2.0, MockUnitConfig(cm_to_unit=10.0)
+        )
+        assert straights[0].length == 100.0
+        assert straights[1].end == (100.0, 50.0, 0.0)
+        # Vectors stay in internal units (cm)
+        assert straights[1].vector == (0.0, 5.0, 0.0)
+
+    def test_prefetched_endpoints_skip_entity_lookup(self, units: MockUnitConfig) -> None:
+        """Supplied line endpoints are used instead of reading the lines."""
+        lines = [UnreadableSketchLine(), UnreadableSketchLine()]
+        endpoints = [
+            ((0.0, 0.0, 0.0), (10.0, 0.0, 0.0)),
+            ((10.0, 0.0, 0.0), (10.0, 5.0, 0.0)),
+        ]
+        straights, bends = calculate_straights_and_bends(
+            lines, [MockArc(2.0)], (0.0, 0.0, 0.0), 2.0, units,
+            line_endpoints=endpoints,
+        )
+        assert [s.length for s in straights] == [10.0, 5.0]
+        assert abs(bends[0].angle - 90.0) < 1e-9
+
+    # Defensive: invalid geometry
+    def test_no_lines_raises(self, units: MockUnitConfig) -> None:
+        with pytest.raises(ValueError, match="No lines"):
+            calculate_straights_and_bends([], [], (0.0, 0.0, 0.0), 2.0, units)
+
+    def test_insufficient_lines_raises(self, units: MockUnitConfig) -> None:
+        lines = [MockSketchLine((0.0, 0.0, 0.0), (10.0, 0.0, 0.0))]
+        with pytest.raises(ValueError, match="Insufficient"):
+            calculate_straights_and_bends(
+                lines, [MockArc(2.0)], (0.0, 0.0, 0.0), 2.0, units
+            )
+
+    def test_zero_length_line_raises(self, units: MockUnitConfig) -> None:
+        lines = [
+            MockSketchLine((0.0, 0.0, 0.0), (10.0, 0.0, 0.0)),
+            MockSketchLine((10.0, 0.0, 0.0), (10.0, 0.0, 0.0)),
+        ]
+        with pytest.raises(ValueError, match="Line 2 has zero length"):
+            calculate_straights_and_bends(
+                lines, [MockArc(2.0)], (0.0, 0.0, 0.0), 2.0, units
+            )
 
 
 # Helper function to create StraightSection objects
@@ -164,7 +225,7 @@ class TestBuildSegmentsAndMarks:
         straights = [make_straight(1, 10.0), make_straight(2, 10.0)]
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=5.0)]
 
-        segments, marks = build_segments_and_marks(
+        segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=2.0, die_offset=0.5
         )
 
@@ -172,11 +233,11 @@ class TestBuildSegmentsAndMarks:
         assert len(segments) == 3
 
         # Check segment order and types
-        assert segments[0].segment_type == 'straight'
+        assert segments[0].segment_type is SegmentType.STRAIGHT
         assert segments[0].name == 'Straight 1'
-        assert segments[1].segment_type == 'bend'
+        assert segments[1].segment_type is SegmentType.BEND
         assert segments[1].name == 'BEND 1'
-        assert segments[2].segment_type == 'straight'
+        assert segments[2].segment_type is SegmentType.STRAIGHT
         assert segments[2].name == 'Straight 2'
 
         # Check cumulative positions
@@ -205,17 +266,17 @@ class TestBuildSegmentsAndMarks:
             BendData(number=2, angle=90.0, rotation=30.0, arc_length=6.0),
         ]
 
-        segments, marks = build_segments_and_marks(
+        segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=1.0
         )
 
         # Should have 5 segments
         assert len(segments) == 5
-        assert segments[0].segment_type == 'straight'
-        assert segments[1].segment_type == 'bend'
-        assert segments[2].segment_type == 'straight'
-        assert segments[3].segment_type == 'bend'
-        assert segments[4].segment_type == 'straight'
+        assert segments[0].segment_type is SegmentType.STRAIGHT
+        assert segments[1].segment_type is SegmentType.BEND
+        assert segments[2].segment_type is SegmentType.STRAIGHT
+        assert segments[3].segment_type is SegmentType.BEND
+        assert segments[4].segment_type is SegmentType.STRAIGHT
 
         # Check mark positions
         assert len(marks) == 2
@@ -224,19 +285,34 @@ class TestBuildSegmentsAndMarks:
         assert marks[1].bend_num == 2
         assert marks[1].mark_position == 21.0  # (10 + 4 + 8) - 1
 
+    def test_total_centerline_excludes_extra_material(self) -> None:
+        """Total is the sum of straight and arc lengths, independent of grip."""
+        straights = [make_straight(1, 10.1), make_straight(2, 7.3), make_straight(3, 3.7)]
+        bends = [
+            BendData(number=1, angle=45.0, rotation=None, arc_length=4.2),
+            BendData(number=2, angle=90.0, rotation=30.0, arc_length=6.9),
+        ]
+
+        _segments, _marks, total = build_segments_and_marks(
+            straights, bends, extra_material=13.37, die_offset=1.0
+        )
+
+        expected = sum(s.length for s in straights) + sum(b.arc_length for b in bends)
+        assert total == pytest.approx(expected, abs=1e-12)
+
     # Defensive: Edge cases
     def test_empty_bends(self) -> None:
         """Path with no bends (just straights)."""
         straights = [make_straight(1, 10.0), make_straight(2, 10.0)]
         bends: list[BendData] = []
 
-        segments, marks = build_segments_and_marks(
+        segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=0.0
         )
 
         # Should have 2 straight segments only
         assert len(segments) == 2
-        assert all(s.segment_type == 'straight' for s in segments)
+        assert all(s.segment_type is SegmentType.STRAIGHT for s in segments)
         assert len(marks) == 0
 
     def test_zero_extra_material(self) -> None:
@@ -244,7 +320,7 @@ class TestBuildSegmentsAndMarks:
         straights = [make_straight(1, 10.0), make_straight(2, 10.0)]
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=5.0)]
 
-        segments, _marks = build_segments_and_marks(
+        segments, _marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=0.5
         )
 
@@ -256,7 +332,7 @@ class TestBuildSegmentsAndMarks:
         straights = [make_straight(1, 10.0), make_straight(2, 10.0)]
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=5.0)]
 
-        _segments, marks = build_segments_and_marks(
+        _segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=2.0, die_offset=0.0
         )
 
@@ -268,7 +344,7 @@ class TestBuildSegmentsAndMarks:
         straights = [make_straight(1, 0.001), make_straight(2, 0.001)]
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=0.0005)]
 
-        segments, marks = build_segments_and_marks(
+        segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=0.0001
         )
 
@@ -290,7 +366,7 @@ class TestBuildSegmentsAndMarks:
             BendData(number=2, angle=90.0, rotation=15.0, arc_length=4.0),
         ]
 
-        segments, _marks = build_segments_and_marks(
+        segments, _marks, _total = build_segments_and_marks(
             straights, bends, extra_material=1.0, die_offset=0.0
         )
 
@@ -314,7 +390,7 @@ class TestBuildSegmentsAndMarks:
             BendData(number=2, angle=90.0, rotation=30.0, arc_length=5.0),  # Has rotation
         ]
 
-        segments, _marks = build_segments_and_marks(
+        segments, _marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=0.0
         )
 
@@ -335,7 +411,7 @@ class TestBuildSegmentsAndMarks:
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=5.0)]
         die_offset = 0.5
 
-        _segments, marks = build_segments_and_marks(
+        _segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=die_offset
         )
 
@@ -350,7 +426,7 @@ class TestBuildSegmentsAndMarks:
         straights = [make_straight(1, 10.0), make_straight(2, 10.0)]
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=5.0)]
 
-        _, marks = build_segments_and_marks(
+        _, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=0.0
         )
 
@@ -366,7 +442,7 @@ class TestBuildSegmentsAndMarks:
         straights = [make_straight(1, 10.0), make_straight(2, 10.0)]
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=5.0)]
 
-        _segments, marks = build_segments_and_marks(
+        _segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=-1.0
         )
 
@@ -400,7 +476,7 @@ class TestEdgeCasePathStructures:
         # extra_material = max(0, 6.0 - 2.5) = 3.5
         extra_material = 3.5
 
-        segments, marks = build_segments_and_marks(
+        segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=extra_material, die_offset=0.5
         )
 
@@ -426,7 +502,7 @@ class TestEdgeCasePathStructures:
         straights = [make_straight(1, 10.0), make_straight(2, 2.0)]  # Last is short
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=5.0)]
 
-        segments, _marks = build_segments_and_marks(
+        segments, _marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=0.5
         )
 
@@ -450,7 +526,7 @@ class TestEdgeCasePathStructures:
         straights: list[StraightSection] = []
         bends = [BendData(number=1, angle=45.0, rotation=None, arc_length=5.0)]
 
-        segments, marks = build_segments_and_marks(
+        segments, marks, _total = build_segments_and_marks(
             straights, bends, extra_material=0.0, die_offset=0.0
         )
 
@@ -704,3 +780,26 @@ class TestSyntheticGripTailFields:
         assert data.has_synthetic_tail is False
         assert data.grip_cut_position is None
         assert data.tail_cut_position is None
+
+
+class TestBendDataModels:
+    """Per-segment value objects are slotted and immutable."""
+
+    def test_value_objects_have_no_instance_dict(self) -> None:
+        objects = [
+            make_straight(1, 10.0),
+            BendData(number=1, angle=90.0, rotation=None, arc_length=5.0),
+            PathSegment(
+                segment_type=SegmentType.STRAIGHT, name='Straight 1', length=10.0,
+                starts_at=0.0, ends_at=10.0, bend_angle=None, rotation=None,
+            ),
+            MarkPosition(bend_num=1, mark_position=10.0, bend_angle=90.0, rotation=None),
+        ]
+        for obj in objects:
+            assert not hasattr(obj, '__dict__')
+
+    def test_value_objects_are_frozen(self) -> None:
+        bend = BendData(number=1, angle=90.0, rotation=None, arc_length=5.0)
+        with pytest.raises(AttributeError):
+            bend.angle = 45.0  # type: ignore[misc]
+
@@ -0,0 +1,75 @@
+"""
+Tests for Create Bend Sheet command lifecycle - runs without Fusion.
+
+Run with: pytest tests/ -v
+"""
+from __future__ import annotations
+
+import importlib
+import types
+from collections.abc import Iterator
+from unittest import mock
+
+import pytest
+
+from helpers import PACKAGE, MockSketchLine, fusion_stubs
+from core.geometry_extraction import (
+    clear_endpoint_cache,
+    get_cached_sketch_entity_endpoints,
+)
+from models.types import Point3D
+
+
+@pytest.fixture(scope='module')
+def entry() -> Iterator[types.ModuleType]:
+    """Import the command entry module against stubbed adsk modules."""
+    with fusion_stubs('commands'):
+        yield importlib.import_module(f'{PACKAGE}.commands.createBendSheet.entry')
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    clear_endpoint_cache()
+    yield
+    clear_endpoint_cache()
+
+
+class TestEndpointCacheLifecycle:
+    """Endpoint cache is scoped to one command session."""
+
+    def test_command_destroy_clears_cache(self, entry: types.ModuleType) -> None:
+        """Closing the dialog drops cached endpoints."""
+        line = MockSketchLine((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), token='line-1')
+        get_cached_sketch_entity_endpoints(line)
+
+        entry.command_destroy(mock.MagicMock())
+
+        get_cached_sketch_entity_endpoints(line)
+        assert line.startSketchPoint.reads == 2
+
+    def test_new_session_reads_edited_geometry(
+        self, entry: types.ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A new command session never serves endpoints cached before an edit."""
+        before = MockSketchLine((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), token='line-1')
+        edited = MockSketchLine((0.0, 0.0, 0.0), (4.0, 0.0, 0.0), token='line-1')
+        get_cached_sketch_entity_endpoints(before)
+        seen: list[tuple[Point3D, Point3D]] = []
+
+        class RecordingValidator:
+            """Reads the edited entity through the cache, then stops the command."""
+
+            def __init__(self, units: object) -> None:
+                pass
+
+            def validate_for_dialog(self, selections: object) -> mock.MagicMock:
+                seen.append(get_cached_sketch_entity_endpoints(edited))
+                return mock.MagicMock(is_valid=False, error_message='stop here')
+
+        monkeypatch.setattr(entry, 'SelectionValidator', RecordingValidator)
+        monkeypatch.setattr(entry, 'ProfileManager', mock.MagicMock())
+        monkeypatch.setattr(entry, 'UnitConfig', mock.MagicMock())
+
+        entry.command_created(mock.MagicMock())
+
+        assert seen == [((0.0, 0.0, 0.0), (4.0, 0.0, 0.0))]
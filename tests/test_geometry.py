@@ -8,12 +8,14 @@ import math
 from core.geometry import (
     ZeroVectorError,
     angle_between_vectors,
+    angle_between_vectors_rad,
     calculate_rotation,
     cross_product,
     distance_between_points,
     dot_product,
     magnitude,
     points_are_close,
+    squared_distance_between_points,
 )
 
 
@@ -97,6 +99,30 @@ class TestAngleBetweenVectors:
         assert 0 <= angle <= 180
 
 
+class TestAngleBetweenVectorsRad:
+    """Test angle_between_vectors_rad() function."""
+
+    def test_perpendicular_vectors_half_pi(self):
+        angle = angle_between_vectors_rad((1.0, 0.0, 0.0), (0.0, 1.0, 0.0))
+        assert abs(angle - math.pi / 2) < 1e-12
+
+    def test_antiparallel_vectors_pi(self):
+        angle = angle_between_vectors_rad((1.0, 0.0, 0.0), (-1.0, 0.0, 0.0))
+        assert abs(angle - math.pi) < 1e-12
+
+    def test_matches_degree_variant(self):
+        v1 = (1.0, 2.0, 3.0)
+        v2 = (-2.0, 0.5, 1.0)
+        assert math.degrees(angle_between_vectors_rad(v1, v2)) == angle_between_vectors(v1, v2)
+
+    def test_zero_vector_raises(self):
+        try:
+            angle_between_vectors_rad((0.0, 0.0, 0.0), (1.0, 0.0, 0.0))
+            raise AssertionError("Should have raised ZeroVectorError")
+        except ZeroVectorError:
+            pass
+
+
 class TestCalculateRotation:
     """Test rotation angle calculations."""
 
@@ -143,3 +169,10 @@ class TestPointOperations:
 
     def test_points_are_close_outside_tolerance(self):
         assert not points_are_close((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), tolerance=0.1)
+
+    def test_squared_distance_3d(self):
+        dist_sq = squared_distance_between_points((0.0, 0.0, 0.0), (1.0, 2.0, 2.0))
+        assert dist_sq == 9.0
+
+    def test_squared_distance_same_point(self):
+        assert squared_distance_between_points((1.0, 2.0, 3.0), (1.0, 2.0, 3.0)) == 0.0
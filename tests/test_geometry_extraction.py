@@ -5,13 +5,30 @@ Run with: pytest tests/ -v
 """
 from __future__ import annotations
 
-from helpers import MockPathElement
+from typing import Any, cast
+
+import pytest
+
+from helpers import MockPathElement, MockSketchLine
+from core import CONNECTIVITY_CM
+from core.geometry import points_are_close
 from core.geometry_extraction import (
+    EndpointIndex,
+    PathElement,
+    clear_endpoint_cache,
     determine_primary_axis,
+    get_cached_sketch_entity_endpoints,
     get_free_endpoint,
+    get_free_endpoints,
     should_reverse_path_direction,
 )
-from models.types import Point3D
+from models.types import ElementType, Point3D
+
+class _NoScanList(list):
+    """List that fails the test if it is iterated."""
+
+    def __iter__(self):
+        raise AssertionError("all_elements was scanned")
 
 
 class TestDeterminePrimaryAxis:
@@ -132,6 +149,18 @@ class TestDeterminePrimaryAxis:
         assert axis == 'X'
         assert current == 'Right'
 
+    def test_zero_displacement_uses_negative_direction(self) -> None:
+        """No movement resolves to X with the negative direction as current."""
+        result = determine_primary_axis((1.0, 2.0, 3.0), (1.0, 2.0, 3.0))
+        assert result == ('X', 0, 'Left', 'Right')
+
+    def test_same_direction_returns_shared_result(self) -> None:
+        """Results come from a precomputed table, not rebuilt per call."""
+        first = determine_primary_axis((0.0, 0.0, 0.0), (0.0, -3.0, 1.0))
+        second = determine_primary_axis((5.0, 5.0, 5.0), (5.0, 1.0, 5.0))
+        assert first == ('Y', 1, 'Bottom', 'Top')
+        assert first is second
+
 
 class TestGetFreeEndpoint:
     """Test get_free_endpoint() function."""
@@ -139,8 +168,8 @@ class TestGetFreeEndpoint:
     # Happy path tests
     def test_finds_unconnected_endpoint_at_start(self) -> None:
         """First element's start is free endpoint of chain."""
-        e1 = MockPathElement('line', ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
-        e2 = MockPathElement('arc', ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
         elements = [e1, e2]
 
         # e1's start (0,0,0) is not connected to e2
@@ -149,8 +178,8 @@ class TestGetFreeEndpoint:
 
     def test_finds_unconnected_endpoint_at_end(self) -> None:
         """Last element's end is free endpoint of chain."""
-        e1 = MockPathElement('line', ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
-        e2 = MockPathElement('arc', ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
         elements = [e1, e2]
 
         # e2's end (2,0,0) is not connected to e1
@@ -159,9 +188,9 @@ class TestGetFreeEndpoint:
 
     def test_middle_element_has_no_free_endpoint(self) -> None:
         """Middle element returns its first endpoint as fallback."""
-        e1 = MockPathElement('line', ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
-        e2 = MockPathElement('arc', ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
-        e3 = MockPathElement('line', ((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)))
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)))
         elements = [e1, e2, e3]
 
         # e2 is connected at both ends, returns its start as fallback
@@ -171,7 +200,7 @@ class TestGetFreeEndpoint:
     # Defensive: Edge cases
     def test_single_element_returns_start(self) -> None:
         """Single element returns its start endpoint."""
-        e1 = MockPathElement('line', ((5.0, 0.0, 0.0), (10.0, 0.0, 0.0)))
+        e1 = MockPathElement(ElementType.LINE, ((5.0, 0.0, 0.0), (10.0, 0.0, 0.0)))
         elements = [e1]
 
         # Both endpoints are free, returns start (first one checked)
@@ -180,8 +209,8 @@ class TestGetFreeEndpoint:
 
     def test_disconnected_element_returns_start(self) -> None:
         """Disconnected element returns its start endpoint."""
-        e1 = MockPathElement('line', ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
-        e2 = MockPathElement('line', ((100.0, 100.0, 100.0), (101.0, 100.0, 100.0)))
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.LINE, ((100.0, 100.0, 100.0), (101.0, 100.0, 100.0)))
         elements = [e1, e2]
 
         # e2 is completely disconnected from e1
@@ -191,9 +220,9 @@ class TestGetFreeEndpoint:
     def test_both_endpoints_connected_returns_first(self) -> None:
         """When both endpoints are connected, returns first endpoint."""
         # Create a closed triangle
-        e1 = MockPathElement('line', ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
-        e2 = MockPathElement('arc', ((1.0, 0.0, 0.0), (0.5, 0.866, 0.0)))
-        e3 = MockPathElement('line', ((0.5, 0.866, 0.0), (0.0, 0.0, 0.0)))
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (0.5, 0.866, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((0.5, 0.866, 0.0), (0.0, 0.0, 0.0)))
         elements = [e1, e2, e3]
 
         # e1 is connected at both ends (to e3 at start, to e2 at end)
@@ -202,7 +231,7 @@ class TestGetFreeEndpoint:
 
     def test_empty_other_elements_returns_start(self) -> None:
         """Element with no others returns its start."""
-        e1 = MockPathElement('line', ((3.0, 4.0, 5.0), (6.0, 7.0, 8.0)))
+        e1 = MockPathElement(ElementType.LINE, ((3.0, 4.0, 5.0), (6.0, 7.0, 8.0)))
         elements = [e1]  # Only itself
 
         result = get_free_endpoint(e1, elements)
@@ -210,9 +239,9 @@ class TestGetFreeEndpoint:
 
     def test_connection_within_tolerance(self) -> None:
         """Elements within tolerance (0.1 cm) are considered connected."""
-        e1 = MockPathElement('line', ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
         # e2 starts at 1.05, within 0.1 cm tolerance
-        e2 = MockPathElement('arc', ((1.05, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.05, 0.0, 0.0), (2.0, 0.0, 0.0)))
         elements = [e1, e2]
 
         # e1's end (1,0,0) is close to e2's start (1.05,0,0) - within tolerance
@@ -222,11 +251,11 @@ class TestGetFreeEndpoint:
 
     def test_long_chain_finds_correct_endpoint(self) -> None:
         """Correctly identifies free endpoint in a long chain."""
-        e1 = MockPathElement('line', ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
-        e2 = MockPathElement('arc', ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
-        e3 = MockPathElement('line', ((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)))
-        e4 = MockPathElement('arc', ((3.0, 0.0, 0.0), (4.0, 0.0, 0.0)))
-        e5 = MockPathElement('line', ((4.0, 0.0, 0.0), (5.0, 0.0, 0.0)))
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)))
+        e4 = MockPathElement(ElementType.ARC, ((3.0, 0.0, 0.0), (4.0, 0.0, 0.0)))
+        e5 = MockPathElement(ElementType.LINE, ((4.0, 0.0, 0.0), (5.0, 0.0, 0.0)))
         elements = [e1, e2, e3, e4, e5]
 
         # First element's start is free
@@ -236,6 +265,312 @@ class TestGetFreeEndpoint:
         # Middle elements return first endpoint as fallback
         assert get_free_endpoint(e3, elements) == (2.0, 0.0, 0.0)
 
+    def test_unordered_elements_still_scanned(self) -> None:
+        """Connections to non-adjacent list entries are still found."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)))
+        elements = [e2, e3, e1]  # e1's only connection (e2) is not beside it
+
+        assert get_free_endpoint(e1, elements) == (0.0, 0.0, 0.0)
+        assert get_free_endpoint(e3, elements) == (3.0, 0.0, 0.0)
+
+    def test_element_not_in_list(self) -> None:
+        """An element outside the list is checked against every entry."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+
+        assert get_free_endpoint(e1, [e2]) == (0.0, 0.0, 0.0)
+
+    def test_shared_index_matches_per_call_index(self) -> None:
+        """Passing a prebuilt index gives the same result as building one."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)))
+        elements = [e1, e2, e3]
+        index = EndpointIndex(elements)
+
+        assert get_free_endpoint(e1, elements, index) == (0.0, 0.0, 0.0)
+        assert get_free_endpoint(e3, elements, index) == (3.0, 0.0, 0.0)
+
+    def test_shared_index_with_own_index_skips_search(self) -> None:
+        """With index and own_index, all_elements is never scanned."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)))
+        elements = _NoScanList([e1, e2, e3])
+        index = EndpointIndex([e1, e2, e3])
+
+        assert get_free_endpoint(e1, elements, index, own_index=0) == (0.0, 0.0, 0.0)
+        assert get_free_endpoint(e3, elements, index, own_index=2) == (3.0, 0.0, 0.0)
+
+    def test_shared_index_without_own_index_skips_search(self) -> None:
+        """With only an index, candidates are identity-checked, not the list."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        elements = _NoScanList([e1, e2])
+        index = EndpointIndex([e1, e2])
+
+        assert get_free_endpoint(e1, elements, index) == (0.0, 0.0, 0.0)
+        assert get_free_endpoint(e2, elements, index) == (2.0, 0.0, 0.0)
+
+    def test_non_finite_endpoint_is_free(self) -> None:
+        """A NaN endpoint touches nothing, so it is reported as free."""
+        nan = float('nan')
+        e1 = MockPathElement(ElementType.LINE, ((nan, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        elements = [e1, e2]
+        index = EndpointIndex(elements)
+
+        result = get_free_endpoint(e1, elements, index, own_index=0)
+        assert result is e1.endpoints[0]
+
+
+class TestGetFreeEndpoints:
+    """Test get_free_endpoints() batch function."""
+
+    def test_matches_per_element_calls(self) -> None:
+        """Batch result equals calling get_free_endpoint for each element."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((3.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        elements = [e1, e2, e3]
+
+        result = get_free_endpoints(elements)
+
+        assert result == [get_free_endpoint(e, elements) for e in elements]
+        assert result == [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (3.0, 0.0, 0.0)]
+
+    def test_empty_chain(self) -> None:
+        assert get_free_endpoints([]) == []
+
+
+class TestEndpointIndex:
+    """Test EndpointIndex spatial hash."""
+
+    def test_finds_elements_sharing_point(self) -> None:
+        """Both elements touching a shared point are found."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        index = EndpointIndex([e1, e2])
+
+        assert index.indices_near((1.0, 0.0, 0.0)) == {0, 1}
+        assert index.indices_near((2.0, 0.0, 0.0)) == {1}
+
+    def test_match_across_cell_boundary(self) -> None:
+        """Points in neighboring cells within tolerance still match."""
+        # 0.099 and 0.101 fall in different 0.1 cm cells
+        e1 = MockPathElement(ElementType.LINE, ((0.099, 0.0, 0.0), (5.0, 0.0, 0.0)))
+        index = EndpointIndex([e1])
+
+        assert index.indices_near((0.101, 0.0, 0.0)) == {0}
+
+    def test_negative_coordinates(self) -> None:
+        """Negative coordinates bucket correctly around zero."""
+        e1 = MockPathElement(ElementType.LINE, ((-0.01, -0.01, -0.01), (-5.0, 0.0, 0.0)))
+        index = EndpointIndex([e1])
+
+        assert index.indices_near((0.01, 0.01, 0.01)) == {0}
+
+    def test_outside_tolerance_not_found(self) -> None:
+        """Points just beyond tolerance are not matched."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        index = EndpointIndex([e1])
+
+        assert index.indices_near((0.0, 0.15, 0.0)) == set()
+
+    def test_custom_tolerance(self) -> None:
+        """Larger tolerance widens matching."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        index = EndpointIndex([e1], tolerance=0.5)
+
+        assert index.indices_near((0.0, 0.4, 0.0)) == {0}
+
+    def test_add_extends_index(self) -> None:
+        """Elements added after construction are found by later lookups."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        index = EndpointIndex()
+        assert index.indices_near((1.0, 0.0, 0.0)) == set()
+
+        index.add(7, e1)
+
+        assert index.indices_near((1.0, 0.0, 0.0)) == {7}
+
+    def test_insert_reports_earlier_neighbors_only(self) -> None:
+        """insert() returns touching elements added before, then indexes."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((5.0, 0.0, 0.0), (6.0, 0.0, 0.0)))
+        index = EndpointIndex()
+
+        assert index.insert(0, e1) == set()
+        assert index.insert(1, e2) == {0}
+        assert index.insert(2, e3) == set()
+        assert index.indices_near((2.0, 0.0, 0.0)) == {1}
+
+    def test_insert_negative_coordinates(self) -> None:
+        """insert() links endpoints in negative cells and across the origin."""
+        e1 = MockPathElement(ElementType.LINE, ((-3.0, -2.0, -1.0), (-0.01, -0.01, -0.01)))
+        e2 = MockPathElement(ElementType.ARC, ((0.01, 0.01, 0.01), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((-3.04, -2.0, -1.0), (-6.0, 0.0, 0.0)))
+        index = EndpointIndex()
+
+        assert index.insert(0, e1) == set()
+        assert index.insert(1, e2) == {0}
+        assert index.insert(2, e3) == {0}
+
+    @pytest.mark.parametrize("offset", [CONNECTIVITY_CM, -CONNECTIVITY_CM])
+    def test_insert_exactly_tolerance_across_boundary(self, offset: float) -> None:
+        """Points exactly one tolerance apart in adjacent cells connect."""
+        # +-0.05 lie on opposite sides of the cell boundary at 0
+        half = offset / 2
+        start = (-half, 0.0, 0.0)
+        end = (half, 0.0, 0.0)
+        assert points_are_close(start, end)
+        e1 = MockPathElement(ElementType.LINE, ((-5.0, 0.0, 0.0), start))
+        e2 = MockPathElement(ElementType.ARC, (end, (5.0, 0.0, 0.0)))
+        index = EndpointIndex()
+
+        assert index.insert(0, e1) == set()
+        assert index.insert(1, e2) == {0}
+
+    @pytest.mark.parametrize("offset", [CONNECTIVITY_CM, -CONNECTIVITY_CM])
+    def test_insert_just_beyond_tolerance_across_boundary(self, offset: float) -> None:
+        """Points just over one tolerance apart in adjacent cells do not connect."""
+        start = (0.0, 0.0, 0.0)
+        end = (offset * 1.001, 0.0, 0.0)
+        e1 = MockPathElement(ElementType.LINE, ((-5.0, 0.0, 0.0), start))
+        e2 = MockPathElement(ElementType.ARC, (end, (5.0, 0.0, 0.0)))
+        index = EndpointIndex()
+
+        assert index.insert(0, e1) == set()
+        assert index.insert(1, e2) == set()
+
+    @pytest.mark.parametrize("bad", [float('nan'), float('inf'), float('-inf'), 1e308])
+    def test_insert_unbucketable_endpoint_does_not_raise(self, bad: float) -> None:
+        """insert() accepts endpoints that have no finite grid cell."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (bad, bad, bad)))
+        e2 = MockPathElement(ElementType.ARC, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        index = EndpointIndex()
+
+        assert index.insert(0, e1) == set()
+        assert index.insert(1, e2) == {0}
+        assert index.insert(2, e3) == {1}
+
+    def test_non_positive_tolerance_raises(self) -> None:
+        """Zero tolerance is rejected."""
+        with pytest.raises(ValueError, match="positive"):
+            EndpointIndex([], tolerance=0.0)
+
+    # Defensive: non-finite and huge coordinates
+    @pytest.mark.parametrize("bad", [float('nan'), float('inf'), float('-inf')])
+    def test_non_finite_endpoint_does_not_raise(self, bad: float) -> None:
+        """NaN/inf endpoints are indexed without error and match nothing."""
+        e1 = MockPathElement(ElementType.LINE, ((bad, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        index = EndpointIndex([e1, e2])
+
+        assert index.indices_near((1.0, 0.0, 0.0)) == {0, 1}
+        assert index.indices_near((bad, 0.0, 0.0)) == set()
+        assert index.indices_near((0.0, 0.0, 0.0)) == set()
+
+    def test_huge_coordinates_still_match(self) -> None:
+        """Coordinates too large to bucket fall back to direct comparison."""
+        huge = (1e308, 0.0, 0.0)
+        e1 = MockPathElement(ElementType.LINE, (huge, (1.0, 0.0, 0.0)))
+        index = EndpointIndex([e1])
+
+        assert index.indices_near(huge) == {0}
+        assert index.indices_near((1.0, 0.0, 0.0)) == {0}
+        assert index.indices_near((-1e308, 0.0, 0.0)) == set()
+
+
+class TestGetCachedSketchEntityEndpoints:
+    """Test get_cached_sketch_entity_endpoints() and clear_endpoint_cache()."""
+
+    def setup_method(self) -> None:
+        clear_endpoint_cache()
+
+    def teardown_method(self) -> None:
+        clear_endpoint_cache()
+
+    def test_second_lookup_skips_geometry_reads(self) -> None:
+        """Repeated lookups for a token reuse the first result."""
+        entity = MockSketchLine((0.0, 0.0, 0.0), (1.0, 2.0, 3.0), token='line-1')
+
+        first = get_cached_sketch_entity_endpoints(entity)
+        second = get_cached_sketch_entity_endpoints(entity)
+
+        assert first == ((0.0, 0.0, 0.0), (1.0, 2.0, 3.0))
+        assert second == first
+        assert entity.startSketchPoint.reads == 1
+        assert entity.endSketchPoint.reads == 1
+
+    def test_clear_forces_fresh_read(self) -> None:
+        """After clearing, geometry is read from the entity again."""
+        entity = MockSketchLine((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), token='line-1')
+        get_cached_sketch_entity_endpoints(entity)
+
+        clear_endpoint_cache()
+        get_cached_sketch_entity_endpoints(entity)
+
+        assert entity.startSketchPoint.reads == 2
+
+    def test_clear_drops_stale_geometry_for_edited_entity(self) -> None:
+        """An entity edited between sessions keeps its token; clearing serves new geometry."""
+        before = MockSketchLine((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), token='line-1')
+        edited = MockSketchLine((0.0, 0.0, 0.0), (4.0, 0.0, 0.0), token='line-1')
+        get_cached_sketch_entity_endpoints(before)
+
+        # Within a session the token is trusted, so the edit is not seen
+        assert get_cached_sketch_entity_endpoints(edited)[1] == (1.0, 0.0, 0.0)
+
+        clear_endpoint_cache()
+        assert get_cached_sketch_entity_endpoints(edited)[1] == (4.0, 0.0, 0.0)
+
+    def test_distinct_tokens_cached_separately(self) -> None:
+        """Different entities don't share cache entries."""
+        a = MockSketchLine((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), token='line-a')
+        b = MockSketchLine((5.0, 0.0, 0.0), (6.0, 0.0, 0.0), token='line-b')
+
+        assert get_cached_sketch_entity_endpoints(a)[0] == (0.0, 0.0, 0.0)
+        assert get_cached_sketch_entity_endpoints(b)[0] == (5.0, 0.0, 0.0)
+
+
+def _mock_line_entity() -> Any:
+    """MockSketchLine to wrap in a PathElement, whose entity is typed as a Fusion SketchLine."""
+    return cast(Any, MockSketchLine((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), token='line-1'))
+
+
+class TestPathElement:
+    """Test PathElement construction."""
+
+    def setup_method(self) -> None:
+        clear_endpoint_cache()
+
+    def teardown_method(self) -> None:
+        clear_endpoint_cache()
+
+    def test_endpoints_extracted_from_entity(self) -> None:
+        entity = _mock_line_entity()
+        element = PathElement(ElementType.LINE, entity)
+        assert element.endpoints == ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0))
+
+    def test_compares_by_identity(self) -> None:
+        """Wrappers with equal fields are still distinct elements."""
+        entity = _mock_line_entity()
+        first = PathElement(ElementType.LINE, entity)
+        second = PathElement(ElementType.LINE, entity)
+        assert first != second
+        assert len({first, second}) == 2
+
+    def test_is_frozen(self) -> None:
+        entity = _mock_line_entity()
+        element = PathElement(ElementType.LINE, entity)
+        with pytest.raises(AttributeError):
+            element.element_type = ElementType.ARC  # type: ignore[misc]
+
 
 class TestShouldReversePathDirection:
     """Test should_reverse_path_direction() function.
@@ -407,15 +742,15 @@ class TestPathNormalizationIntegration:
         # Create path: Front straight -> arc -> Back straight
         # In Fusion: Front is at -Z (low Z), Back is at +Z (high Z)
         front_straight = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((0.0, 0.0, -10.0), (0.0, 0.0, -5.0))  # At Front (low Z)
         )
         arc = MockPathElement(
-            'arc',
+            ElementType.ARC,
             ((0.0, 0.0, -5.0), (0.0, 0.0, 5.0))  # Bend
         )
         back_straight = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((0.0, 0.0, 5.0), (0.0, 0.0, 10.0))  # At Back (high Z)
         )
 
@@ -441,15 +776,15 @@ class TestPathNormalizationIntegration:
     def test_z_axis_back_to_front_stays_unchanged(self) -> None:
         """Path going Back(+Z) to Front(-Z) is reversed to go toward +Z."""
         back_straight = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((0.0, 0.0, 10.0), (0.0, 0.0, 5.0))  # At Back (high Z)
         )
         arc = MockPathElement(
-            'arc',
+            ElementType.ARC,
             ((0.0, 0.0, 5.0), (0.0, 0.0, -5.0))  # Bend
         )
         front_straight = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((0.0, 0.0, -5.0), (0.0, 0.0, -10.0))  # At Front (low Z)
         )
 
@@ -471,15 +806,15 @@ class TestPathNormalizationIntegration:
     def test_x_axis_right_to_left_normalized_to_left_to_right(self) -> None:
         """Path going Right(+X) to Left(-X) is reversed to Left to Right."""
         right_straight = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((10.0, 0.0, 0.0), (5.0, 0.0, 0.0))  # At Right (high X)
         )
         arc = MockPathElement(
-            'arc',
+            ElementType.ARC,
             ((5.0, 0.0, 0.0), (-5.0, 0.0, 0.0))  # Bend
         )
         left_straight = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((-5.0, 0.0, 0.0), (-10.0, 0.0, 0.0))  # At Left (low X)
         )
 
@@ -499,16 +834,16 @@ class TestPathNormalizationIntegration:
         # In Fusion 360: -Z is Front, +Z is Back
         # Front straight at low Z (toward -Z)
         front_straight = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((0.0, 0.0, -10.0), (0.0, 0.0, -5.0))  # At Front (low Z)
         )
         arc = MockPathElement(
-            'arc',
+            ElementType.ARC,
             ((0.0, 0.0, -5.0), (0.0, 0.0, 5.0))
         )
         # Back straight at high Z (toward +Z)
         back_straight = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((0.0, 0.0, 5.0), (0.0, 0.0, 13.0))  # At Back (high Z)
         )
 
@@ -538,15 +873,15 @@ class TestPathNormalizationIntegration:
         # Create elements with distinct positions
         # In Fusion: Front is at -Z, Back is at +Z
         front_element = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((0.0, 0.0, -8.0), (0.0, 0.0, -3.0))  # At Front (negative Z)
         )
         middle_arc = MockPathElement(
-            'arc',
+            ElementType.ARC,
             ((0.0, 0.0, -3.0), (0.0, 0.0, 3.0))
         )
         back_element = MockPathElement(
-            'line',
+            ElementType.LINE,
             ((0.0, 0.0, 3.0), (0.0, 0.0, 8.0))  # At Back (positive Z)
         )
 
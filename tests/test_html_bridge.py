@@ -0,0 +1,122 @@
+"""
+Tests for HTMLBridge display caching - runs without Fusion.
+
+Run with: pytest tests/ -v
+"""
+from __future__ import annotations
+
+import importlib
+import json
+import types
+from collections.abc import Iterator
+
+import pytest
+
+from helpers import PACKAGE, fusion_stubs
+from models.bender import Bender, Die
+from models.units import UnitConfig
+
+
+@pytest.fixture(scope='module')
+def html_bridge() -> Iterator[types.ModuleType]:
+    """Import html_bridge against stubbed adsk modules, restoring sys.modules afterwards."""
+    with fusion_stubs('commands', 'commands.manageBenders'):
+        yield importlib.import_module(f'{PACKAGE}.commands.manageBenders.html_bridge')
+
+
+class FakeBrowserInput:
+    """Records messages sent to the HTML view."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, str]] = []
+
+    def sendInfoToHTML(self, action: str, data: str) -> None:
+        self.sent.append((action, data))
+
+
+def _units(is_metric: bool) -> UnitConfig:
+    if is_metric:
+        return UnitConfig(
+            is_metric=True, unit_name='mm', unit_symbol='mm', cm_to_unit=10.0,
+            default_tube_od='44.45', default_precision=1, valid_precisions=(0, 1, 2),
+        )
+    return UnitConfig(
+        is_metric=False, unit_name='in', unit_symbol='"', cm_to_unit=1.0 / 2.54,
+        default_tube_od='1.75', default_precision=16, valid_precisions=(0, 4, 8, 16, 32),
+    )
+
+
+def _bender() -> Bender:
+    die = Die(id='die-1', name='1.75 x 5.5 CLR', tube_od=4.445, clr=13.97, offset=2.0)
+    return Bender(id='bender-1', name='JD2', min_grip=15.24, dies=[die])
+
+
+@pytest.fixture
+def browser() -> FakeBrowserInput:
+    return FakeBrowserInput()
+
+
+@pytest.fixture
+def bridge(html_bridge: types.ModuleType, browser: FakeBrowserInput):
+    return html_bridge.HTMLBridge(browser, _units(is_metric=False))
+
+
+class TestDisplayCache:
+    """Test invalidation rules of HTMLBridge._display_cache."""
+
+    def test_unchanged_bender_reuses_encoding(self, bridge, browser) -> None:
+        """Sending an unchanged bender twice reuses the cached JSON string."""
+        bender = _bender()
+        bridge.send_bender_update(bender)
+        bridge.send_bender_update(bender)
+        assert browser.sent[0][1] is browser.sent[1][1]
+
+    def test_changed_bender_is_reencoded(self, bridge, browser) -> None:
+        """Editing a bender invalidates its cached encoding."""
+        bender = _bender()
+        bridge.send_bender_update(bender)
+        bender.name = 'JD2 Model 32'
+        bender.dies[0].clr = 15.24
+        bridge.send_bender_update(bender)
+
+        first, second = browser.sent[0][1], browser.sent[1][1]
+        assert first != second
+        data = json.loads(second)
+        assert data['name'] == 'JD2 Model 32'
+        assert data['dies'][0]['clr_display'] == '6.00"'
+
+    def test_set_units_clears_cache(self, bridge, browser) -> None:
+        """Switching units re-encodes display strings in the new unit."""
+        bender = _bender()
+        bridge.send_bender_update(bender)
+        assert bridge._display_cache
+
+        bridge.set_units(_units(is_metric=True))
+        assert not bridge._display_cache
+
+        bridge.send_bender_update(bender)
+        assert json.loads(browser.sent[1][1])['dies'][0]['clr_display'] == '139.70mm'
+
+    def test_removed_bender_is_evicted(self, bridge, browser) -> None:
+        """Removing a bender drops its cache entry."""
+        bender = _bender()
+        other = Bender(id='bender-2', name='Rogue', min_grip=10.0)
+        bridge.send_benders([bender, other])
+        assert set(bridge._display_cache) == {'bender-1', 'bender-2'}
+
+        bridge.send_bender_removed('bender-1')
+        assert set(bridge._display_cache) == {'bender-2'}
+        assert browser.sent[-1] == ('removeBender', 'bender-1')
+
+    def test_remove_unknown_bender_is_noop(self, bridge, browser) -> None:
+        """Removing an uncached bender does not raise."""
+        bridge.send_bender_removed('missing')
+        assert bridge._display_cache == {}
+        assert browser.sent == [('removeBender', 'missing')]
+
+    def test_send_benders_encodes_json_array(self, bridge, browser) -> None:
+        """The batched load message is a JSON array of all benders."""
+        bridge.send_benders([_bender(), Bender(id='bender-2', name='Rogue', min_grip=10.0)])
+        action, data = browser.sent[0]
+        assert action == 'loadBenders'
+        assert [b['id'] for b in json.loads(data)] == ['bender-1', 'bender-2']
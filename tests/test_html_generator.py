@@ -7,6 +7,7 @@ import pytest
 
 from core.html_generator import _escape_html, generate_html_bend_sheet
 from models import BendData, BendSheetData, MarkPosition, PathSegment, StraightSection
+from models.types import SegmentType
 from models.units import UnitConfig
 
 
@@ -63,9 +64,9 @@ def minimal_bend_sheet_data(imperial_units: UnitConfig) -> BendSheetData:
             BendData(number=1, angle=45.0, rotation=None, arc_length=3.14),
         ],
         segments=[
-            PathSegment('straight', 'Straight 1', 10.0, 0.0, 10.0, None, None),
-            PathSegment('bend', 'BEND 1', 3.14, 10.0, 13.14, 45.0, None),
-            PathSegment('straight', 'Straight 2', 8.0, 13.14, 21.14, None, None),
+            PathSegment(SegmentType.STRAIGHT, 'Straight 1', 10.0, 0.0, 10.0, None, None),
+            PathSegment(SegmentType.BEND, 'BEND 1', 3.14, 10.0, 13.14, 45.0, None),
+            PathSegment(SegmentType.STRAIGHT, 'Straight 2', 8.0, 13.14, 21.14, None, None),
         ],
         mark_positions=[
             MarkPosition(1, 9.5, 45.0, None),
@@ -105,11 +106,11 @@ def multi_bend_data(imperial_units: UnitConfig) -> BendSheetData:
             BendData(number=2, angle=90.0, rotation=30.0, arc_length=6.0),
         ],
         segments=[
-            PathSegment('straight', 'Straight 1', 12.0, 2.0, 14.0, None, None),
-            PathSegment('bend', 'BEND 1', 4.0, 14.0, 18.0, 45.0, None),
-            PathSegment('straight', 'Straight 2', 8.0, 18.0, 26.0, None, 30.0),
-            PathSegment('bend', 'BEND 2', 6.0, 26.0, 32.0, 90.0, None),
-            PathSegment('straight', 'Straight 3', 10.0, 32.0, 42.0, None, None),
+            PathSegment(SegmentType.STRAIGHT, 'Straight 1', 12.0, 2.0, 14.0, None, None),
+            PathSegment(SegmentType.BEND, 'BEND 1', 4.0, 14.0, 18.0, 45.0, None),
+            PathSegment(SegmentType.STRAIGHT, 'Straight 2', 8.0, 18.0, 26.0, None, 30.0),
+            PathSegment(SegmentType.BEND, 'BEND 2', 6.0, 26.0, 32.0, 90.0, None),
+            PathSegment(SegmentType.STRAIGHT, 'Straight 3', 10.0, 32.0, 42.0, None, None),
         ],
         mark_positions=[
             MarkPosition(1, 13.25, 45.0, None),
@@ -365,9 +366,9 @@ class TestGenerateHtmlBendSheet:
                 BendData(number=1, angle=90.0, rotation=None, arc_length=179.5),
             ],
             segments=[
-                PathSegment('straight', 'Straight 1', 254.0, 0.0, 254.0, None, None),
-                PathSegment('bend', 'BEND 1', 179.5, 254.0, 433.5, 90.0, None),
-                PathSegment('straight', 'Straight 2', 203.2, 433.5, 636.7, None, None),
+                PathSegment(SegmentType.STRAIGHT, 'Straight 1', 254.0, 0.0, 254.0, None, None),
+                PathSegment(SegmentType.BEND, 'BEND 1', 179.5, 254.0, 433.5, 90.0, None),
+                PathSegment(SegmentType.STRAIGHT, 'Straight 2', 203.2, 433.5, 636.7, None, None),
             ],
             mark_positions=[
                 MarkPosition(1, 241.3, 90.0, None),
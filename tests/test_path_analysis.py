@@ -0,0 +1,80 @@
+"""
+Tests for the deprecated path_analysis re-export shim - runs without Fusion.
+
+Run with: pytest tests/ -v
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+import warnings
+
+import pytest
+
+from helpers import PACKAGE
+
+_MODULE = f'{PACKAGE}.core.path_analysis'
+
+# Names the shim has always re-exported
+_NAMES = (
+    'get_sketch_entity_endpoints',
+    'get_component_name',
+    'PathElement',
+    'PathElementLike',
+    'get_free_endpoint',
+    'determine_primary_axis',
+    'should_reverse_path_direction',
+    'elements_are_connected',
+    'build_ordered_path',
+    'validate_path_alternation',
+)
+
+
+@pytest.fixture
+def path_analysis(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Freshly imported shim, so no names are cached from earlier tests."""
+    monkeypatch.delitem(sys.modules, _MODULE, raising=False)
+    monkeypatch.delattr(sys.modules[f'{PACKAGE}.core'], 'path_analysis', raising=False)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')  # Importing alone must not warn
+        return importlib.import_module(_MODULE)
+
+
+class TestPathAnalysisShim:
+    """Test lazy re-exports and deprecation warnings."""
+
+    def test_all_matches_exports(self, path_analysis: types.ModuleType) -> None:
+        """__all__ lists exactly the names __getattr__ can resolve."""
+        assert set(path_analysis.__all__) == set(path_analysis._EXPORTS) == set(_NAMES)
+
+    @pytest.mark.parametrize("name", _NAMES)
+    def test_name_resolves_with_warning(self, path_analysis: types.ModuleType, name: str) -> None:
+        """Each export is the implementation object and warns at the caller."""
+        target = importlib.import_module(path_analysis._EXPORTS[name], f'{PACKAGE}.core')
+
+        with pytest.warns(DeprecationWarning, match=name) as record:
+            value = getattr(path_analysis, name)
+
+        assert value is getattr(target, name)
+        assert record[0].filename == __file__
+
+    def test_resolved_name_is_cached(self, path_analysis: types.ModuleType) -> None:
+        """A name warns only on first use."""
+        with pytest.warns(DeprecationWarning):
+            first = path_analysis.build_ordered_path
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            assert path_analysis.build_ordered_path is first
+
+    def test_star_import(self, path_analysis: types.ModuleType) -> None:
+        """from core.path_analysis import * resolves every name in __all__."""
+        namespace: dict[str, object] = {}
+        with pytest.warns(DeprecationWarning):
+            exec(f'from {_MODULE} import *', namespace)
+        assert set(path_analysis.__all__) <= set(namespace)
+
+    def test_unknown_name_raises(self, path_analysis: types.ModuleType) -> None:
+        """Type-only names such as SketchEntity are not exported at runtime."""
+        with pytest.raises(AttributeError, match="SketchEntity"):
+            _ = path_analysis.SketchEntity
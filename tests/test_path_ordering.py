@@ -13,6 +13,7 @@ from core.path_ordering import (
     elements_are_connected,
     validate_path_alternation,
 )
+from models.types import ElementType
 
 
 # Test fixtures for common path patterns
@@ -20,7 +21,7 @@ from core.path_ordering import (
 def line_element() -> MockPathElement:
     """A line element from (0,0,0) to (1,0,0)."""
     return MockPathElement(
-        element_type='line',
+        element_type=ElementType.LINE,
         endpoints=((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)),
     )
 
@@ -29,7 +30,7 @@ def line_element() -> MockPathElement:
 def arc_element() -> MockPathElement:
     """An arc element from (1,0,0) to (2,0,0)."""
     return MockPathElement(
-        element_type='arc',
+        element_type=ElementType.ARC,
         endpoints=((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)),
     )
 
@@ -38,7 +39,7 @@ def arc_element() -> MockPathElement:
 def line_element_2() -> MockPathElement:
     """A second line element from (2,0,0) to (3,0,0)."""
     return MockPathElement(
-        element_type='line',
+        element_type=ElementType.LINE,
         endpoints=((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)),
     )
 
@@ -47,7 +48,7 @@ def line_element_2() -> MockPathElement:
 def disconnected_element() -> MockPathElement:
     """An element not connected to others."""
     return MockPathElement(
-        element_type='line',
+        element_type=ElementType.LINE,
         endpoints=((100.0, 100.0, 100.0), (101.0, 100.0, 100.0)),
     )
 
@@ -81,11 +82,11 @@ class TestElementsAreConnected:
     def test_within_tolerance(self) -> None:
         """Elements within point tolerance (0.1 cm) are connected."""
         e1 = MockPathElement(
-            element_type='line',
+            element_type=ElementType.LINE,
             endpoints=((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)),
         )
         e2 = MockPathElement(
-            element_type='arc',
+            element_type=ElementType.ARC,
             endpoints=((1.05, 0.0, 0.0), (2.0, 0.0, 0.0)),  # 0.05 cm off, within 0.1 tolerance
         )
         assert elements_are_connected(e1, e2) is True
@@ -93,11 +94,11 @@ class TestElementsAreConnected:
     def test_outside_tolerance(self) -> None:
         """Elements outside tolerance (0.1 cm) are not connected."""
         e1 = MockPathElement(
-            element_type='line',
+            element_type=ElementType.LINE,
             endpoints=((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)),
         )
         e2 = MockPathElement(
-            element_type='arc',
+            element_type=ElementType.ARC,
             endpoints=((1.2, 0.0, 0.0), (2.0, 0.0, 0.0)),  # 0.2 cm off, > 0.1 tolerance
         )
         assert elements_are_connected(e1, e2) is False
@@ -110,9 +111,9 @@ class TestValidatePathAlternation:
     def test_valid_line_arc_line_pattern(self) -> None:
         """Valid pattern: line -> arc -> line."""
         path = [
-            MockPathElement('line', ((0, 0, 0), (1, 0, 0))),
-            MockPathElement('arc', ((1, 0, 0), (2, 0, 0))),
-            MockPathElement('line', ((2, 0, 0), (3, 0, 0))),
+            MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0))),
+            MockPathElement(ElementType.ARC, ((1, 0, 0), (2, 0, 0))),
+            MockPathElement(ElementType.LINE, ((2, 0, 0), (3, 0, 0))),
         ]
         is_valid, error = validate_path_alternation(path)
         assert is_valid is True
@@ -121,9 +122,9 @@ class TestValidatePathAlternation:
     def test_valid_arc_line_arc_pattern(self) -> None:
         """Valid pattern: arc -> line -> arc."""
         path = [
-            MockPathElement('arc', ((0, 0, 0), (1, 0, 0))),
-            MockPathElement('line', ((1, 0, 0), (2, 0, 0))),
-            MockPathElement('arc', ((2, 0, 0), (3, 0, 0))),
+            MockPathElement(ElementType.ARC, ((0, 0, 0), (1, 0, 0))),
+            MockPathElement(ElementType.LINE, ((1, 0, 0), (2, 0, 0))),
+            MockPathElement(ElementType.ARC, ((2, 0, 0), (3, 0, 0))),
         ]
         is_valid, error = validate_path_alternation(path)
         assert is_valid is True
@@ -131,14 +132,14 @@ class TestValidatePathAlternation:
 
     def test_single_line_valid(self) -> None:
         """Single line element is valid."""
-        path = [MockPathElement('line', ((0, 0, 0), (1, 0, 0)))]
+        path = [MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0)))]
         is_valid, error = validate_path_alternation(path)
         assert is_valid is True
         assert error == ""
 
     def test_single_arc_valid(self) -> None:
         """Single arc element is valid."""
-        path = [MockPathElement('arc', ((0, 0, 0), (1, 0, 0)))]
+        path = [MockPathElement(ElementType.ARC, ((0, 0, 0), (1, 0, 0)))]
         is_valid, error = validate_path_alternation(path)
         assert is_valid is True
         assert error == ""
@@ -146,8 +147,8 @@ class TestValidatePathAlternation:
     def test_two_elements_line_arc_valid(self) -> None:
         """Two elements: line -> arc is valid."""
         path = [
-            MockPathElement('line', ((0, 0, 0), (1, 0, 0))),
-            MockPathElement('arc', ((1, 0, 0), (2, 0, 0))),
+            MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0))),
+            MockPathElement(ElementType.ARC, ((1, 0, 0), (2, 0, 0))),
         ]
         is_valid, _error = validate_path_alternation(path)
         assert is_valid is True
@@ -156,8 +157,8 @@ class TestValidatePathAlternation:
     def test_two_consecutive_lines_invalid(self) -> None:
         """Two lines in a row is invalid."""
         path = [
-            MockPathElement('line', ((0, 0, 0), (1, 0, 0))),
-            MockPathElement('line', ((1, 0, 0), (2, 0, 0))),
+            MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0))),
+            MockPathElement(ElementType.LINE, ((1, 0, 0), (2, 0, 0))),
         ]
         is_valid, error = validate_path_alternation(path)
         assert is_valid is False
@@ -167,8 +168,8 @@ class TestValidatePathAlternation:
     def test_two_consecutive_arcs_invalid(self) -> None:
         """Two arcs in a row is invalid."""
         path = [
-            MockPathElement('arc', ((0, 0, 0), (1, 0, 0))),
-            MockPathElement('arc', ((1, 0, 0), (2, 0, 0))),
+            MockPathElement(ElementType.ARC, ((0, 0, 0), (1, 0, 0))),
+            MockPathElement(ElementType.ARC, ((1, 0, 0), (2, 0, 0))),
         ]
         is_valid, error = validate_path_alternation(path)
         assert is_valid is False
@@ -184,9 +185,9 @@ class TestValidatePathAlternation:
     def test_break_in_middle_invalid(self) -> None:
         """Break in alternation pattern is detected."""
         path = [
-            MockPathElement('line', ((0, 0, 0), (1, 0, 0))),
-            MockPathElement('arc', ((1, 0, 0), (2, 0, 0))),
-            MockPathElement('arc', ((2, 0, 0), (3, 0, 0))),  # Should be line
+            MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0))),
+            MockPathElement(ElementType.ARC, ((1, 0, 0), (2, 0, 0))),
+            MockPathElement(ElementType.ARC, ((2, 0, 0), (3, 0, 0))),  # Should be line
         ]
         is_valid, error = validate_path_alternation(path)
         assert is_valid is False
@@ -201,9 +202,9 @@ class TestBuildOrderedPath:
     def test_simple_three_element_path(self) -> None:
         """Order a simple line -> arc -> line path."""
         # Create elements in random order
-        line1 = MockPathElement('line', ((0, 0, 0), (1, 0, 0)))
-        arc = MockPathElement('arc', ((1, 0, 0), (2, 0, 0)))
-        line2 = MockPathElement('line', ((2, 0, 0), (3, 0, 0)))
+        line1 = MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0)))
+        arc = MockPathElement(ElementType.ARC, ((1, 0, 0), (2, 0, 0)))
+        line2 = MockPathElement(ElementType.LINE, ((2, 0, 0), (3, 0, 0)))
 
         # Pass them out of order
         elements = [arc, line2, line1]
@@ -220,8 +221,8 @@ class TestBuildOrderedPath:
 
     def test_two_element_path(self) -> None:
         """Minimum valid path: 2 connected elements."""
-        line = MockPathElement('line', ((0, 0, 0), (1, 0, 0)))
-        arc = MockPathElement('arc', ((1, 0, 0), (2, 0, 0)))
+        line = MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0)))
+        arc = MockPathElement(ElementType.ARC, ((1, 0, 0), (2, 0, 0)))
 
         ordered, error = build_ordered_path([arc, line])
 
@@ -232,7 +233,7 @@ class TestBuildOrderedPath:
     # Defensive: Edge cases
     def test_single_element_fails(self) -> None:
         """Single element is not a valid path."""
-        line = MockPathElement('line', ((0, 0, 0), (1, 0, 0)))
+        line = MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0)))
         ordered, error = build_ordered_path([line])
 
         assert ordered is None
@@ -247,9 +248,9 @@ class TestBuildOrderedPath:
 
     def test_disconnected_element_fails(self) -> None:
         """Disconnected element causes failure."""
-        line1 = MockPathElement('line', ((0, 0, 0), (1, 0, 0)))
-        arc = MockPathElement('arc', ((1, 0, 0), (2, 0, 0)))
-        disconnected = MockPathElement('line', ((100, 100, 100), (101, 100, 100)))
+        line1 = MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0)))
+        arc = MockPathElement(ElementType.ARC, ((1, 0, 0), (2, 0, 0)))
+        disconnected = MockPathElement(ElementType.LINE, ((100, 100, 100), (101, 100, 100)))
 
         ordered, error = build_ordered_path([line1, arc, disconnected])
 
@@ -260,9 +261,9 @@ class TestBuildOrderedPath:
         """Y-junction (3 branches) causes failure."""
         # Create a Y shape: center point connects to 3 elements
         center = (1, 0, 0)
-        e1 = MockPathElement('line', ((0, 0, 0), center))
-        e2 = MockPathElement('line', (center, (2, 0, 0)))
-        e3 = MockPathElement('line', (center, (1, 1, 0)))
+        e1 = MockPathElement(ElementType.LINE, ((0, 0, 0), center))
+        e2 = MockPathElement(ElementType.LINE, (center, (2, 0, 0)))
+        e3 = MockPathElement(ElementType.LINE, (center, (1, 1, 0)))
 
         ordered, error = build_ordered_path([e1, e2, e3])
 
@@ -272,9 +273,9 @@ class TestBuildOrderedPath:
     def test_closed_loop_fails(self) -> None:
         """Closed loop (no free endpoints) causes failure."""
         # Create a triangle - each element has 2 neighbors
-        e1 = MockPathElement('line', ((0, 0, 0), (1, 0, 0)))
-        e2 = MockPathElement('arc', ((1, 0, 0), (0.5, 0.866, 0)))
-        e3 = MockPathElement('line', ((0.5, 0.866, 0), (0, 0, 0)))
+        e1 = MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0)))
+        e2 = MockPathElement(ElementType.ARC, ((1, 0, 0), (0.5, 0.866, 0)))
+        e3 = MockPathElement(ElementType.LINE, ((0.5, 0.866, 0), (0, 0, 0)))
 
         ordered, error = build_ordered_path([e1, e2, e3])
 
@@ -283,10 +284,10 @@ class TestBuildOrderedPath:
 
     def test_maintains_all_elements(self) -> None:
         """All input elements appear in output."""
-        e1 = MockPathElement('line', ((0, 0, 0), (1, 0, 0)))
-        e2 = MockPathElement('arc', ((1, 0, 0), (2, 0, 0)))
-        e3 = MockPathElement('line', ((2, 0, 0), (3, 0, 0)))
-        e4 = MockPathElement('arc', ((3, 0, 0), (4, 0, 0)))
+        e1 = MockPathElement(ElementType.LINE, ((0, 0, 0), (1, 0, 0)))
+        e2 = MockPathElement(ElementType.ARC, ((1, 0, 0), (2, 0, 0)))
+        e3 = MockPathElement(ElementType.LINE, ((2, 0, 0), (3, 0, 0)))
+        e4 = MockPathElement(ElementType.ARC, ((3, 0, 0), (4, 0, 0)))
 
         ordered, _error = build_ordered_path([e3, e1, e4, e2])
 
@@ -294,3 +295,55 @@ class TestBuildOrderedPath:
         assert len(ordered) == 4
         # All original elements should be in output
         assert {id(e) for e in [e1, e2, e3, e4]} == {id(e) for e in ordered}
+
+    def test_orders_long_shuffled_chain(self) -> None:
+        """A long chain given out of order is traversed end to end."""
+        chain = [
+            MockPathElement(
+                ElementType.LINE if i % 2 == 0 else ElementType.ARC,
+                ((float(i), 0.0, 0.0), (float(i + 1), 0.0, 0.0)),
+            )
+            for i in range(41)
+        ]
+        shuffled = chain[1::2] + chain[::2]
+
+        ordered, error = build_ordered_path(shuffled)
+
+        assert error == ""
+        assert ordered is not None
+        assert ordered in (chain, chain[::-1])
+
+    # Defensive: non-finite and huge coordinates
+    @pytest.mark.parametrize("bad", [float('nan'), float('inf'), float('-inf')])
+    def test_non_finite_joint_reports_disconnected(self, bad: float) -> None:
+        """A NaN/inf shared point cannot connect, so ordering fails cleanly."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (bad, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((bad, 0.0, 0.0), (2.0, 0.0, 0.0)))
+
+        ordered, error = build_ordered_path([e1, e2])
+
+        assert ordered is None
+        assert "disconnected" in error
+
+    @pytest.mark.parametrize("bad", [float('nan'), float('inf'), float('-inf')])
+    def test_non_finite_free_end_still_orders(self, bad: float) -> None:
+        """A NaN/inf coordinate on an unconnected end does not break ordering."""
+        e1 = MockPathElement(ElementType.LINE, ((bad, 0.0, 0.0), (1.0, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1.0, 0.0, 0.0), (2.0, 0.0, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((2.0, 0.0, 0.0), (3.0, 0.0, 0.0)))
+
+        ordered, error = build_ordered_path([e2, e3, e1])
+
+        assert error == ""
+        assert ordered in ([e1, e2, e3], [e3, e2, e1])
+
+    def test_huge_coordinates_order(self) -> None:
+        """Coordinates too large for the spatial grid still connect."""
+        e1 = MockPathElement(ElementType.LINE, ((0.0, 0.0, 0.0), (1e308, 0.0, 0.0)))
+        e2 = MockPathElement(ElementType.ARC, ((1e308, 0.0, 0.0), (1e308, 1e308, 0.0)))
+        e3 = MockPathElement(ElementType.LINE, ((1e308, 1e308, 0.0), (1e308, 1e308, 1e308)))
+
+        ordered, error = build_ordered_path([e3, e1, e2])
+
+        assert error == ""
+        assert ordered in ([e1, e2, e3], [e3, e2, e1])
@@ -25,6 +25,8 @@ class DistanceUnits:
 class SketchEntity:
     @property
     def parentSketch(self) -> 'Sketch | None': ...
+    @property
+    def entityToken(self) -> str: ...
 
 class SketchCurve(SketchEntity):
     @property